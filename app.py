@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import logging
+import os
 import sys
-from datetime import date, time
+from datetime import date
+from pathlib import Path
+from typing import Any, Coroutine, List, Optional, Sequence, Tuple
+
+import orjson
 
 from engine.conversation import ReservationAgent
-from memory.models import DesiredReservation, SemanticMemory
-from dotenv import load_dotenv
+from memory.models import CoreMemory, DesiredReservation, SemanticMemory
+from persistence.json_saver import transcript_path_for
 
-load_dotenv()
+_PROFILES_DIR = Path(__file__).resolve().parent / "configs" / "profiles"
+_DEFAULT_PROFILE = "default"
+_QUIT_TOKENS = frozenset({"quit", "exit", "q"})
 
+# Guest data, desired booking (None: taken from the guest data) and persona
+# (None: the built-in Sarah Mitchell persona).
+Profile = Tuple[SemanticMemory, Optional[DesiredReservation], Optional[CoreMemory]]
+
+
+def _available_profiles() -> List[str]:
+    """Return the built-in profile plus every JSON profile on disk."""
+
+    return [_DEFAULT_PROFILE, *sorted(p.stem for p in _PROFILES_DIR.glob("*.json"))]
 
-def run_cli() -> None:
-    """Start a simple CLI loop to interact with the agent."""
 
-    # Create default Sarah Mitchell profile
+def _default_profile() -> Profile:
+    """Build the default Sarah Mitchell profile."""
+
     semantic_memory = SemanticMemory.create(
         guest_name="Sarah Mitchell",
         guest_phone="+1-555-123-4567",
@@ -31,10 +50,127 @@ def run_cli() -> None:
         occasion="dinner",
         special_requests="the steak must be rare",
     )
+    return semantic_memory, desired_reservation, None
+
+
+def _load_profile(name: str) -> Profile:
+    """Return the guest profile.
+
+    JSON profiles are a serialized `SemanticMemory` (which carries the desired
+    reservation) plus an optional `core` section with the persona to play.
+    """
+
+    if name == _DEFAULT_PROFILE:
+        return _default_profile()
+    data = orjson.loads((_PROFILES_DIR / f"{name}.json").read_bytes())
+    core = data.pop("core", None)
+    return (
+        SemanticMemory.model_validate(data),
+        None,
+        CoreMemory.model_validate(core) if core is not None else None,
+    )
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--profile",
+        choices=_available_profiles(),
+        default=_DEFAULT_PROFILE,
+        help="Guest profile to role-play (JSON files live in configs/profiles).",
+    )
+    parser.add_argument(
+        "--runs",
+        type=_positive_int,
+        default=1,
+        help="Start N agents concurrently and print their opening lines, "
+        "instead of the interactive loop.",
+    )
+    return parser.parse_args(argv)
+
+
+def _print_streamed_reply(
+    agent: ReservationAgent, user_message: Optional[str] = None
+) -> bool:
+    """Print the agent reply as it streams in and return the done flag."""
+
+    done = False
+    print("Agent: ", end="", flush=True)
+    for delta, done in agent.stream_step(user_message):
+        print(delta, end="", flush=True)
+    print()
+    return done
+
+
+def _run_async(main: Coroutine[Any, Any, None]) -> None:
+    """Run `main` on uvloop when installed (`pip install -e .[fast]`), else asyncio."""
+
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+        return
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main)
+
+
+async def _run_openings(profile: str, runs: int) -> None:
+    """Build `runs` agents in one process and await their opening turns together."""
+
+    from engine.llm import AsyncOpenRouterLLMClient
+
+    # One client serves every agent; leaving the block closes its connection pool.
+    async with AsyncOpenRouterLLMClient() as llm_client:
+        agents = []
+        for _ in range(runs):
+            semantic_memory, desired_reservation, core_memory = _load_profile(profile)
+            agents.append(
+                ReservationAgent(
+                    semantic_memory=semantic_memory,
+                    desired_reservation=desired_reservation,
+                    llm_client=llm_client,
+                    core_memory=core_memory,
+                )
+            )
+        results = await asyncio.gather(*(agent.astep() for agent in agents))
+    for index, (reply, _) in enumerate(results, start=1):
+        print(f"[{index}] Agent: {reply}")
+
+
+def run_cli(argv: Optional[Sequence[str]] = None) -> None:
+    """Start a simple CLI loop to interact with the agent."""
+
+    args = _parse_args(argv)
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    # Set AGENT_LOG_LEVEL=DEBUG to print rendered prompts and state snapshots.
+    logging.basicConfig(level=os.getenv("AGENT_LOG_LEVEL", "WARNING").upper())
+
+    if args.runs > 1:
+        _run_async(_run_openings(args.profile, args.runs))
+        return
+
+    semantic_memory, desired_reservation, core_memory = _load_profile(args.profile)
 
     agent = ReservationAgent(
         semantic_memory=semantic_memory,
         desired_reservation=desired_reservation,
+        transcript_path=transcript_path_for(semantic_memory.guest_name),
+        core_memory=core_memory,
     )
     print("=== Restaurant Reservation Simulation ===")
     print(
@@ -42,20 +178,18 @@ def run_cli() -> None:
     )
 
     try:
-        reply = agent.step()
-        print(f"Agent: {reply}")
+        done = _print_streamed_reply(agent)
         while True:
-            if agent.is_complete():
+            if done:
                 print("\nProcess completed.")
                 break
             user_message = input("You: ").strip()
-            if user_message.lower() in {"quit", "exit"}:
+            if user_message.lower() in _QUIT_TOKENS:
                 print("Ending conversation. Goodbye!")
                 break
             if not user_message:
                 continue
-            reply = agent.step(user_message)
-            print(f"Agent: {reply}")
+            done = _print_streamed_reply(agent, user_message)
     except KeyboardInterrupt:
         print("\nConversation interrupted. Goodbye!")
     except Exception as exc:  # pragma: no cover
@@ -0,0 +1,103 @@
+"""Batch executor that marshals several independent turns into one LLM call."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Dict, List, Sequence, Tuple, Type
+
+from jinja2 import Template
+from pydantic import BaseModel, create_model
+
+from memory.models import GlobalMemory
+from shared.enums import SkillName
+
+from .executor import AsyncLLMClientProtocol, ExecutorAgent
+
+BatchRequest = Tuple[SkillName, GlobalMemory, str]
+
+_BATCH_TEMPLATE_PATH = "skills/batch.j2"
+
+
+@functools.lru_cache(maxsize=None)
+def _batch_model(output_model: Type[BaseModel]) -> Type[BaseModel]:
+    """Return the `{"items": [...]}` response model for a skill output model.
+
+    instructor's JSON mode asks for a top-level JSON object, so the list of
+    outputs is wrapped in one rather than sent as a bare array.
+    """
+
+    return create_model(
+        f"{output_model.__name__}Batch",
+        items=(List[output_model], ...),  # type: ignore[valid-type]
+    )
+
+
+class BatchExecutor(ExecutorAgent):
+    """Runs turns from many dialogues with one structured call per batch.
+
+    Requests are grouped by skill, because one response model must describe
+    every item in a batch, and each group is split into batches of at most
+    `max_batch_size` prompts. Batches are issued concurrently.
+    """
+
+    def __init__(
+        self, llm_client: AsyncLLMClientProtocol, max_batch_size: int = 8
+    ) -> None:
+        super().__init__(llm_client=llm_client)
+        self._max_batch_size = max_batch_size
+        self._batch_template: Template = self._env.get_template(_BATCH_TEMPLATE_PATH)
+
+    async def run_batch(self, requests: Sequence[BatchRequest]) -> List[BaseModel]:
+        """Execute every request and return outputs in request order."""
+
+        groups: Dict[SkillName, List[int]] = {}
+        for index, (skill_name, _, _) in enumerate(requests):
+            groups.setdefault(skill_name, []).append(index)
+
+        chunks = [
+            (skill_name, indices[start : start + self._max_batch_size])
+            for skill_name, indices in groups.items()
+            for start in range(0, len(indices), self._max_batch_size)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._run_chunk(skill_name, [requests[i] for i in indices])
+                for skill_name, indices in chunks
+            )
+        )
+
+        outputs: List[BaseModel] = [None] * len(requests)  # type: ignore[list-item]
+        for (_, indices), chunk_outputs in zip(chunks, results):
+            for index, output in zip(indices, chunk_outputs):
+                outputs[index] = output
+        return outputs
+
+    async def _run_chunk(
+        self, skill_name: SkillName, requests: Sequence[BatchRequest]
+    ) -> List[BaseModel]:
+        """Send one batch of same-skill prompts and unpack the list response."""
+
+        skill = self._skills[skill_name]
+        # Every request in the chunk is a different dialogue, so each prompt gets
+        # its own static prelude; the compiled templates are shared.
+        prompts = skill.render_many(
+            self._env,
+            (
+                {"state": state, "user_message": user_message, "skill": skill}
+                for _, state, user_message in requests
+            ),
+        )
+        batch_prompt = self._batch_template.render(prompts=prompts)
+        response = await self._llm_client.agenerate(  # type: ignore[union-attr]
+            prompt=batch_prompt,
+            response_model=_batch_model(skill.output_model),
+            skill=skill,
+        )
+        items = response.items  # type: ignore[attr-defined]
+        if len(items) != len(requests):
+            raise ValueError(
+                f"Batch for skill {skill_name.value} returned {len(items)} outputs "
+                f"for {len(requests)} tasks."
+            )
+        return items
@@ -2,17 +2,43 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import logging
+import warnings
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from pydantic import BaseModel
 
 from engine.coordinator import CoordinatorAgent
-from engine.executor import ExecutorAgent, LLMClientProtocol
+from engine.executor import AsyncLLMClientProtocol, ExecutorAgent, LLMClientProtocol
 from engine.llm import OpenRouterLLMClient
-from memory.models import DesiredReservation, GlobalMemory, SemanticMemory
+from memory.models import (
+    CoreMemory,
+    DesiredReservation,
+    GlobalMemory,
+    SemanticMemory,
+)
 from memory.state_manager import (
     apply_skill_output,
     create_initial_state,
     record_user_turn,
 )
+from persistence.json_saver import append_transcript_turn
+from shared.enums import SkillName
+
+logger = logging.getLogger(__name__)
+
+
+class _LazyJson:
+    """Defers `model_dump_json` until a log record is actually formatted."""
+
+    __slots__ = ("_model",)
+
+    def __init__(self, model: BaseModel) -> None:
+        self._model = model
+
+    def __str__(self) -> str:
+        return self._model.model_dump_json()
 
 
 class ReservationAgent:
@@ -22,21 +48,36 @@ class ReservationAgent:
         self,
         semantic_memory: SemanticMemory,
         desired_reservation: DesiredReservation,
-        llm_client: Optional[LLMClientProtocol] = None,
+        llm_client: Optional[Union[LLMClientProtocol, AsyncLLMClientProtocol]] = None,
+        transcript_path: Optional[Union[str, Path]] = None,
+        core_memory: Optional[CoreMemory] = None,
     ) -> None:
         """Initialize the reservation agent.
 
         Args:
             semantic_memory: SemanticMemory with guest/restaurant data.
             desired_reservation: DesiredReservation with booking preferences.
-            llm_client: Optional LLM client for generating responses.
+            llm_client: Optional LLM client for generating responses. Pass an
+                async client (e.g. AsyncOpenRouterLLMClient) to use `astep`
+                and `arun_until_done`.
+            transcript_path: Optional JSONL file that receives every turn. Working
+                memory only keeps the most recent turns, so this is the full log.
+            core_memory: Optional CoreMemory with the persona to role-play;
+                defaults to the built-in Sarah Mitchell persona.
         """
+        self._transcript_path = str(transcript_path) if transcript_path else None
         self._state: GlobalMemory = create_initial_state(
-            semantic_memory=semantic_memory, desired_reservation=desired_reservation
+            semantic_memory=semantic_memory,
+            desired_reservation=desired_reservation,
+            transcript_path=self._transcript_path,
+            core_memory=core_memory,
         )
         self._coordinator = CoordinatorAgent()
+        self._routed_state: Optional[GlobalMemory] = None
+        self._routed_skill: Optional[SkillName] = None
         client = llm_client or OpenRouterLLMClient()
         self._executor = ExecutorAgent(llm_client=client)
+        self._executor.bind_static_context(self._state)
 
     @property
     def state(self) -> GlobalMemory:
@@ -45,35 +86,152 @@ class ReservationAgent:
         return self._state
 
     def is_complete(self) -> bool:
-        """Return True when the workflow reached a terminal stage."""
+        """Return True when the workflow reached a terminal stage.
+
+        Deprecated: use the ``done`` flag returned by `step` instead.
+        """
 
-        return self._coordinator.select_skill(self._state) is None
+        warnings.warn(
+            "ReservationAgent.is_complete() is deprecated; use the done flag "
+            "returned by step().",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._next_skill() is None
 
-    def step(self, user_message: Optional[str] = None) -> str:
-        """Process an optional user message and return the agent reply."""
+    def step(self, user_message: Optional[str] = None) -> tuple[str, bool]:
+        """Process an optional user message.
+
+        Returns:
+            The agent reply and whether the workflow reached a terminal stage.
+        """
 
         if user_message:
-            self._state = record_user_turn(self._state, user_message)
+            self._record_user(user_message)
 
-        skill_name = self._coordinator.select_skill(self._state)
+        skill_name = self._next_skill()
         if skill_name is None:
-            return "Rezerwacja została już zakończona."
+            return "Rezerwacja została już zakończona.", True
 
         last_user_message = self._state.working.last_user_message or ""
         output = self._executor.run(skill_name, self._state, last_user_message)
-        self._state = apply_skill_output(self._state, skill_name, output)
-        return output.ai_response  # type: ignore
+        self._apply(skill_name, output)
+        return output.ai_response, self._next_skill() is None  # type: ignore
+
+    def stream_step(
+        self, user_message: Optional[str] = None
+    ) -> Iterator[tuple[str, bool]]:
+        """Streaming variant of `step` for interactive use.
+
+        Yields ``(delta, done)`` pairs: each delta extends the reply text and
+        ``done`` is only meaningful on the last pair, which is emitted after the
+        final output has been applied to the state. If the final reply does not
+        extend the streamed prefix, the last delta is a newline followed by the
+        full final reply.
+        """
+
+        if user_message:
+            self._record_user(user_message)
+
+        skill_name = self._next_skill()
+        if skill_name is None:
+            yield "Rezerwacja została już zakończona.", True
+            return
+
+        last_user_message = self._state.working.last_user_message or ""
+        emitted = ""
+        output: Optional[BaseModel] = None
+        for output in self._executor.stream(skill_name, self._state, last_user_message):
+            text = getattr(output, "ai_response", None) or ""
+            if len(text) > len(emitted) and text.startswith(emitted):
+                yield text[len(emitted) :], False
+                emitted = text
+        assert output is not None
+        self._apply(skill_name, output)
+        final_text = output.ai_response  # type: ignore
+        if final_text.startswith(emitted):
+            delta = final_text[len(emitted) :]
+        else:
+            # The model revised text that was already shown; restate the reply.
+            logger.warning(
+                "Streamed %s reply diverged from the final text; re-emitting it.",
+                skill_name.value,
+            )
+            delta = "\n" + final_text
+        yield delta, self._next_skill() is None
 
     def run_until_done(self) -> list[str]:
         """Execute skills until the workflow finishes (useful for demos/tests)."""
 
         responses: list[str] = []
         while True:
-            skill_name = self._coordinator.select_skill(self._state)
+            skill_name = self._next_skill()
             if skill_name is None:
                 break
             last_user_message = self._state.working.last_user_message or ""
             output = self._executor.run(skill_name, self._state, last_user_message)
-            self._state = apply_skill_output(self._state, skill_name, output)
+            self._apply(skill_name, output)
+            responses.append(output.ai_response)
+        return responses
+
+    async def astep(self, user_message: Optional[str] = None) -> tuple[str, bool]:
+        """Async variant of `step` that awaits the LLM call."""
+
+        if user_message:
+            self._record_user(user_message)
+
+        skill_name = self._next_skill()
+        if skill_name is None:
+            return "Rezerwacja została już zakończona.", True
+
+        last_user_message = self._state.working.last_user_message or ""
+        output = await self._executor.arun(skill_name, self._state, last_user_message)
+        self._apply(skill_name, output)
+        return output.ai_response, self._next_skill() is None  # type: ignore
+
+    async def arun_until_done(self) -> list[str]:
+        """Async variant of `run_until_done`.
+
+        Many agents can be driven concurrently on one event loop, e.g.
+        `await asyncio.gather(*(agent.arun_until_done() for agent in agents))`.
+        """
+
+        responses: list[str] = []
+        while True:
+            skill_name = self._next_skill()
+            if skill_name is None:
+                break
+            last_user_message = self._state.working.last_user_message or ""
+            output = await self._executor.arun(
+                skill_name, self._state, last_user_message
+            )
+            self._apply(skill_name, output)
             responses.append(output.ai_response)
         return responses
+
+    def _record_user(self, message: str) -> None:
+        """Record a user turn in the state and the transcript."""
+
+        self._state = record_user_turn(self._state, message)
+        if self._transcript_path:
+            append_transcript_turn(self._transcript_path, "user", message)
+
+    def _apply(self, skill_name: SkillName, output: BaseModel) -> None:
+        """Fold a skill output into the state snapshot."""
+
+        # Write the transcript first: the save skill snapshots the transcript from
+        # inside `apply_skill_output`, and it must include this reply.
+        if self._transcript_path:
+            append_transcript_turn(
+                self._transcript_path, "agent", output.ai_response  # type: ignore
+            )
+        self._state = apply_skill_output(self._state, skill_name, output)
+        logger.debug("State after %s: %s", skill_name, _LazyJson(self._state))
+
+    def _next_skill(self) -> Optional[SkillName]:
+        """Route the current snapshot, reusing the answer until the state changes."""
+
+        if self._routed_state is not self._state:
+            self._routed_skill = self._coordinator.select_skill(self._state)
+            self._routed_state = self._state
+        return self._routed_skill
@@ -2,39 +2,114 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Protocol
+import logging
+from typing import Any, Dict, Iterator, Mapping, Protocol, Union
 
+from jinja2 import Template
 from pydantic import BaseModel
 
 from memory.models import GlobalMemory
 from shared.enums import SkillName
+from skills.base import Skill
 from skills.registry import get_skill
-from templates.environment import create_environment
+from templates.environment import get_environment
+
+logger = logging.getLogger(__name__)
 
 
 class ExecutorAgent:
     """Executes a single skill by rendering its prompt and calling the LLM."""
 
-    def __init__(self, llm_client: "LLMClientProtocol") -> None:
+    def __init__(
+        self, llm_client: Union["LLMClientProtocol", "AsyncLLMClientProtocol"]
+    ) -> None:
         self._llm_client = llm_client
-        self._env = create_environment()
+        self._env = get_environment()
+        # Skills and their compiled templates never change, so resolve them once.
+        self._skills: Dict[SkillName, Skill] = {
+            name: get_skill(name) for name in SkillName
+        }
+        self._templates: Dict[SkillName, Template] = {
+            name: skill.get_template(self._env) for name, skill in self._skills.items()
+        }
+        self._static_prompts: Dict[SkillName, str] = {}
+        # Generate response schemas now rather than on the first turn.
+        for skill in self._skills.values():
+            skill.output_model.model_json_schema()
+
+    def bind_static_context(self, state: GlobalMemory) -> None:
+        """Pre-render each skill's static prelude from the session's read-only layers.
+
+        `state.core` and `state.semantic` are fixed for the lifetime of a
+        conversation, so the persona/guest sections are rendered once here
+        instead of on every turn.
+        """
+
+        context = {"state": state}
+        self._static_prompts = {
+            name: skill.render_static(self._env, context)
+            for name, skill in self._skills.items()
+        }
 
     def run(
         self, skill_name: SkillName, state: GlobalMemory, user_message: str
     ) -> BaseModel:
         """Execute a skill and return the structured output."""
 
-        skill = get_skill(skill_name)
+        skill, prompt = self._prepare(skill_name, state, user_message)
+        return self._llm_client.generate(  # type: ignore[union-attr]
+            prompt=prompt, response_model=skill.output_model, skill=skill, state=state
+        )
+
+    async def arun(
+        self, skill_name: SkillName, state: GlobalMemory, user_message: str
+    ) -> BaseModel:
+        """Async counterpart of `run` for clients exposing `agenerate`."""
+
+        skill, prompt = self._prepare(skill_name, state, user_message)
+        return await self._llm_client.agenerate(  # type: ignore[union-attr]
+            prompt=prompt, response_model=skill.output_model, skill=skill, state=state
+        )
+
+    def stream(
+        self, skill_name: SkillName, state: GlobalMemory, user_message: str
+    ) -> Iterator[BaseModel]:
+        """Yield partial outputs while the LLM streams; the last item is final.
+
+        Clients without `stream_generate` fall back to a single `generate` call.
+        """
+
+        skill, prompt = self._prepare(skill_name, state, user_message)
+        stream_generate = getattr(self._llm_client, "stream_generate", None)
+        if stream_generate is None:
+            yield self._llm_client.generate(  # type: ignore[union-attr]
+                prompt=prompt,
+                response_model=skill.output_model,
+                skill=skill,
+                state=state,
+            )
+            return
+        yield from stream_generate(
+            prompt=prompt, response_model=skill.output_model, skill=skill, state=state
+        )
+
+    def _prepare(
+        self, skill_name: SkillName, state: GlobalMemory, user_message: str
+    ) -> tuple[Skill, str]:
+        """Resolve the skill and render its prompt for the current state."""
+
+        skill = self._skills[skill_name]
         context: Mapping[str, Any] = {
             "state": state,
             "user_message": user_message,
             "skill": skill,
         }
-        prompt = skill.render_prompt(self._env, context)
-        print(f"[DEBUG] Generated prompt for skill {skill_name}:\n{prompt}\n")
-        return self._llm_client.generate(
-            prompt=prompt, response_model=skill.output_model, skill=skill, state=state
-        )
+        static = self._static_prompts.get(skill_name)
+        if static is None:
+            static = skill.render_static(self._env, context)
+        prompt = static + self._templates[skill_name].render(context)
+        logger.debug("Generated prompt for skill %s:\n%s", skill_name, prompt)
+        return skill, prompt
 
 
 class LLMClientProtocol(Protocol):
@@ -43,3 +118,11 @@ class LLMClientProtocol(Protocol):
     def generate(
         self, prompt: str, response_model: type[BaseModel], **kwargs: Any
     ) -> BaseModel: ...
+
+
+class AsyncLLMClientProtocol(Protocol):
+    """Protocol for async LLM clients used by `ExecutorAgent.arun`."""
+
+    async def agenerate(
+        self, prompt: str, response_model: type[BaseModel], **kwargs: Any
+    ) -> BaseModel: ...
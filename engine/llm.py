@@ -2,22 +2,89 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
-from typing import Any
+import time
+import weakref
+from typing import Any, ClassVar, Iterator, NamedTuple
 
-import instructor
-from dotenv import load_dotenv
-from openai import OpenAI
 from pydantic import BaseModel
 
-from .executor import LLMClientProtocol
+from .executor import AsyncLLMClientProtocol, LLMClientProtocol
+from .response_cache import MAX_CACHEABLE_TEMPERATURE, ResponseCache, get_response_cache
 
-# Load .env once so OpenRouter credentials can be provided outside the shell.
-load_dotenv()
+# instructor, openai, httpx, tenacity and dotenv are imported inside the clients:
+# they add hundreds of milliseconds of startup, and stub clients never need them.
 
 
-class OpenRouterLLMClient(LLMClientProtocol):
-    """LLM client that calls OpenRouter via the official OpenAI SDK."""
+@functools.lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load .env once so OpenRouter credentials can be provided outside the shell."""
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _is_rate_limited(exc: BaseException | None) -> bool:
+    """Return True for a 429, including one instructor re-raised in a wrapper.
+
+    instructor reports provider errors as `InstructorRetryException` raised
+    from the original exception, so the cause chain is searched.
+    """
+
+    from openai import RateLimitError
+
+    while exc is not None:
+        if isinstance(exc, RateLimitError):
+            return True
+        exc = exc.__cause__
+    return False
+
+
+class TokenBucket:
+    """Async token bucket that spaces requests to stay under an RPM budget."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create a bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum burst size; the bucket starts full.
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class _LoopResources(NamedTuple):
+    """Limits and connection pool shared by every async client on one event loop."""
+
+    semaphore: asyncio.Semaphore
+    bucket: TokenBucket
+    http_client: Any
+
+
+class _OpenRouterClientBase:
+    """Shared configuration for the sync and async OpenRouter clients."""
 
     BASE_URL = "https://openrouter.ai/api/v1"
 
@@ -29,12 +96,14 @@ class OpenRouterLLMClient(LLMClientProtocol):
         temperature: float | None = None,
         max_output_tokens: int | None = None,
     ) -> None:
+        _load_env()
         key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not key:
             raise RuntimeError(
                 "OPENROUTER_API_KEY is not set. Export it to use the live OpenRouter client."
             )
 
+        self._api_key = key
         self._model = model or os.getenv("OPENROUTER_MODEL", "openai/gpt-4o-mini")
         self._temperature = (
             temperature
@@ -46,20 +115,220 @@ class OpenRouterLLMClient(LLMClientProtocol):
             if max_output_tokens is not None
             else int(os.getenv("OPENROUTER_MAX_OUTPUT_TOKENS", "1200"))
         )
-        raw_client = OpenAI(base_url=self.BASE_URL, api_key=key)
+        # Only (near-)deterministic sampling makes identical prompts reusable.
+        self._cache: ResponseCache | None = (
+            get_response_cache()
+            if self._temperature <= MAX_CACHEABLE_TEMPERATURE
+            else None
+        )
+
+    def _prompt_to_messages(self, prompt: str) -> list[dict[str, str]]:
+        """Convert a raw prompt into chat messages format."""
+        return [{"role": "system", "content": prompt}]
+
+    def _cache_lookup(
+        self, prompt: str, response_model: type[BaseModel]
+    ) -> tuple[bytes | None, BaseModel | None]:
+        """Return the cache key (None when caching is off) and any cached output."""
+
+        if self._cache is None:
+            return None, None
+        key = ResponseCache.make_key(self._model, prompt, response_model)
+        return key, self._cache.get(key, response_model)
+
+    def _cache_store(self, key: bytes | None, output: BaseModel) -> None:
+        if key is not None and self._cache is not None:
+            self._cache.put(key, output)
+
+
+class OpenRouterLLMClient(_OpenRouterClientBase, LLMClientProtocol):
+    """LLM client that calls OpenRouter via the official OpenAI SDK."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        import instructor
+        from openai import OpenAI
+
+        super().__init__(**kwargs)
+        raw_client = OpenAI(base_url=self.BASE_URL, api_key=self._api_key)
         self._client = instructor.patch(raw_client, mode=instructor.Mode.JSON)
 
     def generate(
         self, prompt: str, response_model: type[BaseModel], **_: Any
     ) -> BaseModel:
-        return self._client.chat.completions.create(
+        key, cached = self._cache_lookup(prompt, response_model)
+        if cached is not None:
+            return cached
+        output = self._client.chat.completions.create(
             model=self._model,
             messages=self._prompt_to_messages(prompt),
             temperature=self._temperature,
             max_tokens=self._max_output_tokens,
             response_model=response_model,  # type: ignore
         )
+        self._cache_store(key, output)
+        return output
 
-    def _prompt_to_messages(self, prompt: str) -> list[dict[str, str]]:
-        """Convert a raw prompt into chat messages format."""
-        return [{"role": "system", "content": prompt}]
+    def stream_generate(
+        self, prompt: str, response_model: type[BaseModel], **_: Any
+    ) -> Iterator[BaseModel]:
+        """Yield partial outputs as tokens arrive, then the validated final model."""
+
+        import instructor
+
+        key, cached = self._cache_lookup(prompt, response_model)
+        if cached is not None:
+            yield cached
+            return
+        partials = self._client.chat.completions.create(
+            model=self._model,
+            messages=self._prompt_to_messages(prompt),
+            temperature=self._temperature,
+            max_tokens=self._max_output_tokens,
+            response_model=instructor.Partial[response_model],  # type: ignore
+            stream=True,
+        )
+        last: BaseModel | None = None
+        for partial in partials:
+            last = partial
+            yield partial
+        if last is None:
+            raise RuntimeError("OpenRouter returned an empty stream.")
+        output = response_model.model_validate(last.model_dump(exclude_none=True))
+        self._cache_store(key, output)
+        yield output
+
+
+class AsyncOpenRouterLLMClient(_OpenRouterClientBase, AsyncLLMClientProtocol):
+    """Async OpenRouter client so many dialogues can share one event loop.
+
+    Instances on the same event loop share one semaphore, one token bucket and
+    one pooled HTTP/2 connection. Agents built side by side therefore jointly
+    respect `OPENROUTER_MAX_CONCURRENCY` and `OPENROUTER_REQUESTS_PER_MINUTE`,
+    and requests are multiplexed instead of paying a TLS handshake per SDK
+    instance. These resources are kept per loop because asyncio primitives and
+    connections bind to the loop that first uses them; close the pool with
+    `aclose()` (or `async with client:`) once the loop's dialogues are done.
+    Rate-limited calls are retried with jittered exponential backoff.
+    """
+
+    MAX_ATTEMPTS = 6
+    MAX_CONNECTIONS = 128
+
+    _loop_resources: ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopResources]
+    ] = weakref.WeakKeyDictionary()
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Resources and instructor client of the loop this instance last ran on.
+        self._bound: tuple[_LoopResources, Any] | None = None
+
+    async def __aenter__(self) -> AsyncOpenRouterLLMClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the running loop's shared connection pool.
+
+        Every client on the loop uses this pool, so call it once when they are
+        all done; a later request on the loop opens a fresh pool.
+        """
+
+        resources = self._loop_resources.pop(asyncio.get_running_loop(), None)
+        if resources is not None:
+            await resources.http_client.aclose()
+
+    @classmethod
+    def _resources(cls) -> _LoopResources:
+        """Return the running loop's shared resources, creating them on first use."""
+
+        loop = asyncio.get_running_loop()
+        resources = cls._loop_resources.get(loop)
+        if resources is None:
+            rpm = float(os.getenv("OPENROUTER_REQUESTS_PER_MINUTE", "600"))
+            resources = cls._loop_resources[loop] = _LoopResources(
+                semaphore=asyncio.Semaphore(
+                    int(os.getenv("OPENROUTER_MAX_CONCURRENCY", "32"))
+                ),
+                # Bursts are capped at one second's worth of requests; a bucket
+                # holding a full minute would let ~2x the budget out at start.
+                bucket=TokenBucket(rate=rpm / 60, capacity=max(1, rpm // 60)),
+                http_client=cls._new_http_client(),
+            )
+        return resources
+
+    @classmethod
+    def _new_http_client(cls) -> Any:
+        """Open the pooled HTTP/2 connection shared by one loop's clients."""
+
+        import httpx
+
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=cls.MAX_CONNECTIONS,
+                max_keepalive_connections=cls.MAX_CONNECTIONS,
+            ),
+        )
+
+    def _client_for(self, resources: _LoopResources) -> Any:
+        """Return an instructor-patched SDK client that uses the loop's pool."""
+
+        bound = self._bound
+        if bound is None or bound[0] is not resources:
+            import instructor
+            from openai import AsyncOpenAI
+
+            # Retries are owned by `agenerate`, so the SDK does not add its own.
+            raw_client = AsyncOpenAI(
+                base_url=self.BASE_URL,
+                api_key=self._api_key,
+                http_client=resources.http_client,
+                max_retries=0,
+            )
+            client = instructor.patch(raw_client, mode=instructor.Mode.JSON)
+            bound = self._bound = (resources, client)
+        return bound[1]
+
+    async def agenerate(
+        self, prompt: str, response_model: type[BaseModel], **_: Any
+    ) -> BaseModel:
+        from tenacity import (
+            AsyncRetrying,
+            retry_if_exception,
+            stop_after_attempt,
+            wait_exponential_jitter,
+        )
+
+        key, cached = self._cache_lookup(prompt, response_model)
+        if cached is not None:
+            return cached
+        retrying = AsyncRetrying(
+            retry=retry_if_exception(_is_rate_limited),
+            wait=wait_exponential_jitter(),
+            stop=stop_after_attempt(self.MAX_ATTEMPTS),
+            reraise=True,
+        )
+        output = await retrying(self._create_within_limits, prompt, response_model)
+        self._cache_store(key, output)
+        return output
+
+    async def _create_within_limits(
+        self, prompt: str, response_model: type[BaseModel]
+    ) -> BaseModel:
+        """Issue one request once a concurrency slot and a rate token are free."""
+
+        resources = self._resources()
+        client = self._client_for(resources)
+        async with resources.semaphore:
+            await resources.bucket.acquire()
+            return await client.chat.completions.create(
+                model=self._model,
+                messages=self._prompt_to_messages(prompt),
+                temperature=self._temperature,
+                max_tokens=self._max_output_tokens,
+                response_model=response_model,  # type: ignore
+            )
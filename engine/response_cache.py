@@ -0,0 +1,97 @@
+"""Memoisation of structured LLM responses for deterministic requests."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+# Above this temperature two identical prompts may legitimately differ, so
+# responses are not cached.
+MAX_CACHEABLE_TEMPERATURE = 0.01
+
+# Default bound on in-memory entries; the least recently used are evicted.
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ResponseCache:
+    """Stores validated outputs keyed by model, output schema and prompt.
+
+    Entries are kept in a bounded in-process LRU, or in a `diskcache.Cache`
+    (which enforces its own size limit) when a directory is given so repeated
+    evaluation runs share them.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        default_ttl: Optional[float] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._disk: Any = None
+        self._memory: OrderedDict[bytes, Tuple[Optional[float], str]] = OrderedDict()
+        if directory:
+            import diskcache
+
+            self._disk = diskcache.Cache(directory)
+
+    @staticmethod
+    def make_key(model: str, prompt: str, response_model: Type[BaseModel]) -> bytes:
+        """Hash everything that determines the response into a compact key."""
+
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (model, response_model.__qualname__, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.digest()
+
+    def get(self, key: bytes, response_model: Type[BaseModel]) -> Optional[BaseModel]:
+        """Return the cached output for `key`, or None on a miss or expiry."""
+
+        if self._disk is not None:
+            payload = self._disk.get(key)
+        else:
+            entry = self._memory.get(key)
+            payload = None
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at is not None and expires_at < time.monotonic():
+                    del self._memory[key]
+                    payload = None
+                else:
+                    self._memory.move_to_end(key)
+        if payload is None:
+            return None
+        return response_model.model_validate_json(payload)
+
+    def put(self, key: bytes, output: BaseModel, ttl: Optional[float] = None) -> None:
+        """Store `output` under `key` for `ttl` seconds (forever when None)."""
+
+        ttl = ttl if ttl is not None else self._default_ttl
+        payload = output.model_dump_json()
+        if self._disk is not None:
+            self._disk.set(key, payload, expire=ttl)
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._memory[key] = (expires_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide cache configured from the environment."""
+
+    ttl = os.getenv("OPENROUTER_CACHE_TTL")
+    return ResponseCache(
+        directory=os.getenv("OPENROUTER_CACHE_DIR") or None,
+        default_ttl=float(ttl) if ttl else None,
+    )
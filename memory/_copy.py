@@ -0,0 +1,31 @@
+"""Copy helpers that skip work for immutable and empty values."""
+
+from __future__ import annotations
+
+import copy
+from enum import Enum
+from typing import Any
+
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def smart_deepcopy(obj: Any) -> Any:
+    """Deep-copy `obj`, returning immutables as-is and short-circuiting empties.
+
+    Dicts and lists (the shapes of JSON payloads and schemas) are rebuilt
+    recursively without `copy.deepcopy`'s memo bookkeeping; anything else falls
+    back to `copy.deepcopy`.
+    """
+
+    obj_type = type(obj)
+    if obj_type in _IMMUTABLE_TYPES or isinstance(obj, Enum):
+        return obj
+    if obj_type is dict:
+        return {key: smart_deepcopy(value) for key, value in obj.items()}
+    if obj_type is list:
+        return [smart_deepcopy(item) for item in obj]
+    if obj_type in (tuple, frozenset) and not obj:
+        return obj
+    if obj_type is set and not obj:
+        return set()
+    return copy.deepcopy(obj)
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Sequence
+from operator import attrgetter
 from datetime import date as dt_date, time as dt_time, timedelta
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, overload
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    field_validator,
+)
+from pydantic_core import core_schema
 
 from shared.enums import (
     AvailabilityStatus,
@@ -14,17 +24,137 @@ from shared.enums import (
     WorkflowStage,
 )
 
+# Number of recent turns kept in working memory. Older turns are dropped from the
+# state and survive only in the optional on-disk transcript.
+MAX_TURNS_WINDOW = 50
+
+# Default list values are kept as tuples so factories only copy them.
+_PERSONA = (
+    "You are Sarah Mitchell, a thoughtful person who wants to book a table at Azure Bistro. "
+    "Always speak as a guest (never as staff), share only personal data from memory, and "
+    "respond with gratitude even when availability is limited. Keep your responses to maximum two "
+    "concise sentences and reveal only details that are currently being asked by staff."
+)
+_DEFAULT_LANGUAGES = ("en",)
+_CORE_PRINCIPLES = (
+    "Always speak as a guest and never pretend to be staff.",
+    "Thank them for every response and show patience.",
+    "Do not make up new contact information.",
+    "Ask for clarification instead of guessing when you don't know something.",
+    "Respond in maximum two sentences and only within the scope of what is being asked.",
+)
+
+
+# Layers and value objects that are never edited after construction are frozen,
+# so state copies can share them by reference instead of deep-copying.
+_FROZEN = ConfigDict(frozen=True)
+
+# Layers the handlers edit in place. Assignment validation stays off (pydantic's
+# default) so flag flips are plain attribute writes; unknown keys are rejected.
+_MUTABLE = ConfigDict(extra="forbid", frozen=False, validate_assignment=False)
+
+
+def _tomorrow() -> dt_date:
+    """Default reservation date: the day after today."""
+
+    return dt_date.today() + timedelta(days=1)
+
 
 class ConversationTurn(BaseModel):
     """Represents a single entry in the short-term transcript."""
 
+    model_config = _FROZEN
+
     speaker: str
     message: str
 
 
+class TurnLog(Sequence):
+    """Append-only window of turns whose storage is shared between snapshots.
+
+    Each log is a `[start, stop)` view over an arena list. Appending to the
+    newest snapshot extends the arena in place and returns a longer view, so
+    older snapshots keep seeing their own range and no turns are copied. A
+    snapshot that is no longer the newest forks its range into a fresh arena.
+    """
+
+    __slots__ = ("_arena", "_start", "_stop")
+
+    def __init__(self, turns: Iterable[ConversationTurn] = ()) -> None:
+        self._arena: List[ConversationTurn] = list(turns)
+        self._start = 0
+        self._stop = len(self._arena)
+
+    @classmethod
+    def _view(cls, arena: List[ConversationTurn], start: int, stop: int) -> TurnLog:
+        log = cls.__new__(cls)
+        log._arena, log._start, log._stop = arena, start, stop
+        return log
+
+    def appended(self, turn: ConversationTurn, window: int) -> TurnLog:
+        """Return a log with `turn` added, keeping at most `window` turns."""
+
+        arena, start, stop = self._arena, self._start, self._stop
+        # Fork when another snapshot already extended the arena, or compact once
+        # evicted turns dominate it.
+        if stop != len(arena) or start > window:
+            arena, start, stop = arena[start:stop], 0, stop - start
+        arena.append(turn)
+        stop += 1
+        return self._view(arena, max(start, stop - window), stop)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> ConversationTurn: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ConversationTurn]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return self._arena[self._start : self._stop][index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("turn index out of range")
+        return self._arena[self._start + index]
+
+    def __iter__(self) -> Iterator[ConversationTurn]:
+        return iter(self._arena[self._start : self._stop])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TurnLog):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TurnLog({list(self)!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        turns_schema = handler.generate_schema(List[ConversationTurn])
+        return core_schema.union_schema(
+            [
+                core_schema.is_instance_schema(cls),
+                core_schema.no_info_after_validator_function(cls, turns_schema),
+            ],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=turns_schema
+            ),
+        )
+
+
 class ReservationDetails(BaseModel):
     """Structured information that is required to book a table."""
 
+    model_config = _FROZEN
+
     date: Optional[dt_date] = None
     time: Optional[dt_time] = None
     party_size: Optional[int] = Field(default=None, ge=1, le=16)
@@ -37,6 +167,8 @@ class ReservationDetails(BaseModel):
 class MenuPreferences(BaseModel):
     """Captures optional menu discussion outcomes."""
 
+    model_config = _FROZEN
+
     requested: bool = False
     highlights: List[str] = Field(default_factory=list)
     dietary_notes: Optional[str] = None
@@ -45,6 +177,8 @@ class MenuPreferences(BaseModel):
 class AlternativeOption(BaseModel):
     """A candidate slot suggested by the staff when no tables are available."""
 
+    model_config = _FROZEN
+
     description: str
     notes: Optional[str] = None
     accepted: bool = False
@@ -53,29 +187,25 @@ class AlternativeOption(BaseModel):
 class CoreMemory(BaseModel):
     """Static identity and guardrails for the guest persona."""
 
+    model_config = _FROZEN
+
     agent_name: str = "Sarah"
-    persona: str = (
-        "You are Sarah Mitchell, a thoughtful person who wants to book a table at Azure Bistro. "
-        "Always speak as a guest (never as staff), share only personal data from memory, and "
-        "respond with gratitude even when availability is limited. Keep your responses to maximum two "
-        "concise sentences and reveal only details that are currently being asked by staff."
-    )
-    languages: List[str] = Field(default_factory=lambda: ["en"])
-    core_principles: List[str] = Field(
-        default_factory=lambda: [
-            "Always speak as a guest and never pretend to be staff.",
-            "Thank them for every response and show patience.",
-            "Do not make up new contact information.",
-            "Ask for clarification instead of guessing when you don't know something.",
-            "Respond in maximum two sentences and only within the scope of what is being asked.",
-        ]
-    )
+    persona: str = _PERSONA
+    # Tuples, not lists: the default instance below is shared across sessions.
+    languages: Tuple[str, ...] = _DEFAULT_LANGUAGES
+    core_principles: Tuple[str, ...] = _CORE_PRINCIPLES
+
+
+# Core memory is frozen, so every session without a custom persona shares one.
+_DEFAULT_CORE = CoreMemory()
 
 
 class DesiredReservation(BaseModel):
     """Preferred booking parameters the guest would like to request."""
 
-    date: dt_date = Field(default_factory=lambda: dt_date.today() + timedelta(days=1))
+    model_config = _FROZEN
+
+    date: dt_date = Field(default_factory=_tomorrow)
     time: dt_time = dt_time(hour=19, minute=0)
     party_size: int = 2
     occasion: Optional[str] = ""
@@ -85,15 +215,37 @@ class DesiredReservation(BaseModel):
 class SemanticMemory(BaseModel):
     """Long-term knowledge the guest relies on."""
 
+    model_config = _FROZEN
+
     restaurant_name: str = ""
     guest_name: str = ""
     guest_phone: str = ""
     celebration_reason: str = ""
-    favorite_dishes: List[str] = Field(default_factory=lambda: [])
+    favorite_dishes: List[str] = Field(default_factory=list)
     dietary_notes: Optional[str] = ""
-    talking_points: List[str] = Field(default_factory=lambda: [])
+    talking_points: List[str] = Field(default_factory=list)
     desired_reservation: DesiredReservation = Field(default_factory=DesiredReservation)
-    fallback_slots: List[str] = Field(default_factory=lambda: [])
+    fallback_slots: List[str] = Field(default_factory=list)
+
+    @field_validator(
+        "restaurant_name",
+        "guest_name",
+        "guest_phone",
+        "celebration_reason",
+        "favorite_dishes",
+        "dietary_notes",
+        "talking_points",
+        "fallback_slots",
+    )
+    @classmethod
+    def _intern_strings(cls, value: Any) -> Any:
+        """Intern profile strings so agents built from one profile share them."""
+
+        if isinstance(value, str):
+            return sys.intern(value)
+        if isinstance(value, list):
+            return [sys.intern(item) for item in value]
+        return value
 
     @classmethod
     def create(
@@ -125,12 +277,16 @@ class SemanticMemory(BaseModel):
 class EpisodicMemory(BaseModel):
     """Log of important learning moments."""
 
+    model_config = _FROZEN
+
     events: List[str] = Field(default_factory=list)
 
 
 class ConfirmedFields(BaseModel):
     """Tracks which reservation fields have been explicitly confirmed by staff."""
 
+    model_config = _MUTABLE
+
     date: bool = False
     time: bool = False
     party_size: bool = False
@@ -141,22 +297,38 @@ class ConfirmedFields(BaseModel):
 
     def all_required_confirmed(self) -> bool:
         """Check if all fields (date, time, party_size, occasion, special_requests, contact_name, contact_phone) are confirmed."""
-        return all(
-            [
-                self.date,
-                self.time,
-                self.party_size,
-                self.occasion,
-                self.special_requests,
-                self.contact_name,
-                self.contact_phone,
-            ]
+        return (
+            self.date
+            and self.time
+            and self.party_size
+            and self.occasion
+            and self.special_requests
+            and self.contact_name
+            and self.contact_phone
         )
 
 
+# Order in which missing reservation details are asked for, as (field, getter)
+# pairs bound once so the scan skips name resolution.
+_CONTACT_FIELD_PRIORITY = tuple(
+    (field, attrgetter(field))
+    for field in (
+        "party_size",
+        "contact_name",
+        "contact_phone",
+        "occasion",
+        "special_requests",
+        "date",
+        "time",
+    )
+)
+
+
 class WorkflowMemory(BaseModel):
     """Guest-centric state flags that drive the coordinator."""
 
+    model_config = _MUTABLE
+
     stage: WorkflowStage = WorkflowStage.INTRO
     availability_status: AvailabilityStatus = AvailabilityStatus.UNKNOWN
     confirmation_status: ConfirmationStatus = ConfirmationStatus.PENDING
@@ -167,36 +339,87 @@ class WorkflowMemory(BaseModel):
     saved_file_path: Optional[str] = None
     current_topic: DiscussionTopic = DiscussionTopic.NONE
 
+    def next_missing_field(self) -> Optional[str]:
+        """Return the first unconfirmed field in asking order, or None."""
+
+        confirmed = self.confirmed_fields
+        for field, is_set in _CONTACT_FIELD_PRIORITY:
+            if not is_set(confirmed):
+                return field
+        return None
+
+    def mark_fields_confirmed(self, names: Tuple[str, ...]) -> None:
+        """Confirm several flags in one write.
+
+        `names` must be `ConfirmedFields` field names; callers pass module
+        constants that are checked once at import time.
+        """
+        confirmed = self.confirmed_fields
+        confirmed.__dict__.update(dict.fromkeys(names, True))
+        confirmed.__pydantic_fields_set__.update(names)
+
 
 class WorkingMemory(BaseModel):
     """Short-term scratchpad for the current dialogue."""
 
-    turns: List[ConversationTurn] = Field(default_factory=list)
+    model_config = _MUTABLE
+
+    turns: TurnLog = Field(default_factory=TurnLog)
+    archived_turn_count: int = 0
+    transcript_path: Optional[str] = None
     last_user_message: Optional[str] = None
     last_ai_message: Optional[str] = None
-    goal_reservation: ReservationDetails = Field(default_factory=ReservationDetails)
+    goal_reservation: ReservationDetails = Field(
+        default_factory=ReservationDetails.model_construct
+    )
     confirmed_reservation: ReservationDetails = Field(
-        default_factory=ReservationDetails
+        default_factory=ReservationDetails.model_construct
+    )
+    menu_preferences: MenuPreferences = Field(
+        default_factory=MenuPreferences.model_construct
     )
-    menu_preferences: MenuPreferences = Field(default_factory=MenuPreferences)
-    proposed_alternatives: List[AlternativeOption] = Field(default_factory=list)
-    pending_questions: List[str] = Field(default_factory=list)
+    # Tuples are accepted so the common empty cases can share `()`.
+    proposed_alternatives: Sequence[AlternativeOption] = ()
+    pending_questions: Sequence[str] = ()
+
+    def with_turn(self, speaker: str, message: str) -> WorkingMemory:
+        """Return a copy with the turn appended; `self` is left untouched."""
+
+        return self.model_copy(update=self._turn_update(speaker, message))
+
+    def _turn_update(self, speaker: str, message: str) -> Dict[str, Any]:
+        """Field values that record one more turn, evicting beyond the window."""
+
+        turns = self.turns
+        # Speaker/message come from internal callers, so skip re-validation.
+        turn = ConversationTurn.model_construct(speaker=speaker, message=message)
+        new_turns = turns.appended(turn, MAX_TURNS_WINDOW)
+        evicted = len(turns) + 1 - len(new_turns)
+        message_field = "last_user_message" if speaker == "user" else "last_ai_message"
+        return {
+            "turns": new_turns,
+            "archived_turn_count": self.archived_turn_count + evicted,
+            message_field: message,
+        }
 
 
 class GlobalMemory(BaseModel):
     """Container that aggregates every memory layer."""
 
-    core: CoreMemory = Field(default_factory=CoreMemory)
+    # Snapshots are replaced, never edited: a new state is built with
+    # `model_copy(update=...)` around private copies of the layers that change.
+    model_config = _FROZEN
+
+    core: CoreMemory = Field(default_factory=lambda: _DEFAULT_CORE)
     semantic: SemanticMemory = Field(default_factory=SemanticMemory)
     episodic: EpisodicMemory = Field(default_factory=EpisodicMemory)
     workflow: WorkflowMemory = Field(default_factory=WorkflowMemory)
     working: WorkingMemory = Field(default_factory=WorkingMemory)
 
     def append_turn(self, speaker: str, message: str) -> None:
-        """Append a conversation turn to working memory."""
+        """Append a conversation turn, evicting the oldest beyond the window."""
 
-        self.working.turns.append(ConversationTurn(speaker=speaker, message=message))
-        if speaker == "user":
-            self.working.last_user_message = message
-        else:
-            self.working.last_ai_message = message
+        working = self.working
+        # Every caller holds a private copy of `working`, so edit it in place.
+        for field, value in working._turn_update(speaker, message).items():
+            setattr(working, field, value)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from pydantic import BaseModel
 
 from memory.models import (
     AlternativeOption,
+    ConfirmedFields,
+    CoreMemory,
     DesiredReservation,
     GlobalMemory,
     ReservationDetails,
@@ -38,6 +40,30 @@ if TYPE_CHECKING:  # pragma: no cover
 UpdateHandler = Callable[[GlobalMemory, BaseModel], None]
 
 
+# Confirmed-field groups flipped together; names are checked below at import.
+_SLOT_FIELDS: Tuple[str, ...] = ("date", "time")
+_STAFF_CONFIRMED_FIELDS: Tuple[str, ...] = (
+    "date",
+    "time",
+    "party_size",
+    "contact_name",
+    "contact_phone",
+    "special_requests",
+)
+if not ConfirmedFields.model_fields.keys() >= {
+    *_SLOT_FIELDS,
+    *_STAFF_CONFIRMED_FIELDS,
+}:
+    raise RuntimeError("confirmed-field groups must name ConfirmedFields fields")
+
+
+class _HandlerSpec(NamedTuple):
+    """A skill's state handler plus which optional containers it edits in place."""
+
+    handler: UpdateHandler
+    touches_confirmed_fields: bool
+
+
 def _get_missing_explicit_confirmations(
     state: GlobalMemory, confirmed: ReservationDetails
 ) -> List[str]:
@@ -57,16 +83,6 @@ def _get_missing_explicit_confirmations(
     return missing
 
 
-_CONTACT_FIELD_PRIORITY = [
-    "party_size",
-    "contact_name",
-    "contact_phone",
-    "occasion",
-    "special_requests",
-    "date",
-    "time",
-]
-
 _FIELD_TOPIC_MAP = {
     "date": DiscussionTopic.CONFIRMING_DATE,
     "time": DiscussionTopic.CONFIRMING_TIME,
@@ -78,16 +94,49 @@ _FIELD_TOPIC_MAP = {
 }
 
 
-def _get_next_missing_field(workflow: WorkflowMemory) -> Optional[str]:
-    for field in _CONTACT_FIELD_PRIORITY:
-        if not getattr(workflow.confirmed_fields, field):
-            return field
-    return None
+# Words in a staff clarification that reopen a previously confirmed field.
+_CLARIFICATION_KEYWORDS = (
+    ("date", "date"),
+    ("time", "time"),
+    ("phone", "contact_phone"),
+    ("name", "contact_name"),
+)
+
+# Shared empty value for `WorkingMemory.pending_questions`.
+_NO_QUESTIONS: Tuple[str, ...] = ()
+
+# Shared empty value for `WorkingMemory.proposed_alternatives`.
+_NO_ALTERNATIVES: Tuple[AlternativeOption, ...] = ()
+
+# Frozen, all-None details used when a details turn carries no payload.
+_NO_DETAILS = ReservationDetails.model_construct()
+
+# Template for staff-suggested slots; copies skip re-running validation.
+_DEFAULT_ALTERNATIVE = AlternativeOption(description="", accepted=False)
+
+_AVAILABILITY_STAGES = {
+    AvailabilityStatus.SLOT_ACCEPTED: WorkflowStage.PROVIDE_CONTACT,
+    AvailabilityStatus.WAITING_ON_STAFF: WorkflowStage.AWAIT_AVAILABILITY,
+    AvailabilityStatus.ALTERNATIVES_OFFERED: WorkflowStage.REVIEW_ALTERNATIVES,
+    AvailabilityStatus.DECLINED: WorkflowStage.REVIEW_ALTERNATIVES,
+}
+
+_STAGE_TO_TOPIC: Dict[WorkflowStage, Optional[DiscussionTopic]] = {
+    WorkflowStage.INTRO: DiscussionTopic.GREETING,
+    WorkflowStage.SHARE_PREFERENCES: DiscussionTopic.CONFIRMING_AVAILABILITY,
+    WorkflowStage.AWAIT_AVAILABILITY: DiscussionTopic.CONFIRMING_AVAILABILITY,
+    WorkflowStage.REVIEW_ALTERNATIVES: DiscussionTopic.CONFIRMING_AVAILABILITY,
+    WorkflowStage.PROVIDE_CONTACT: None,
+    WorkflowStage.MENU_DISCUSSION: DiscussionTopic.MENU_DISCUSSION,
+    WorkflowStage.AWAIT_CONFIRMATION: DiscussionTopic.CONFIRMATION,
+    WorkflowStage.SAVE_DATA: DiscussionTopic.CLOSING,
+    WorkflowStage.WRAP_UP: DiscussionTopic.CLOSING,
+    WorkflowStage.END: DiscussionTopic.CLOSING,
+}
 
 
 def _topic_from_field(field_name: Optional[str]) -> DiscussionTopic:
-    if not field_name:
-        return DiscussionTopic.CONFIRMING_CONTACT_DETAILS
+    # None and unknown names both fall back to the contact-details topic.
     return _FIELD_TOPIC_MAP.get(field_name, DiscussionTopic.CONFIRMING_CONTACT_DETAILS)
 
 
@@ -98,61 +147,54 @@ def _sync_topic_with_stage(
         workflow.current_topic = DiscussionTopic.ERROR_RECOVERY
         return
 
-    stage = workflow.stage
-    if stage == WorkflowStage.INTRO:
-        workflow.current_topic = DiscussionTopic.GREETING
-    elif stage in {
-        WorkflowStage.SHARE_PREFERENCES,
-        WorkflowStage.AWAIT_AVAILABILITY,
-        WorkflowStage.REVIEW_ALTERNATIVES,
-    }:
-        workflow.current_topic = DiscussionTopic.CONFIRMING_AVAILABILITY
-    elif stage == WorkflowStage.PROVIDE_CONTACT:
-        workflow.current_topic = _topic_from_field(next_missing_field)
-    elif stage == WorkflowStage.MENU_DISCUSSION:
-        workflow.current_topic = DiscussionTopic.MENU_DISCUSSION
-    elif stage == WorkflowStage.AWAIT_CONFIRMATION:
-        workflow.current_topic = DiscussionTopic.CONFIRMATION
-    elif stage in {WorkflowStage.SAVE_DATA, WorkflowStage.WRAP_UP, WorkflowStage.END}:
-        workflow.current_topic = DiscussionTopic.CLOSING
-    else:
-        workflow.current_topic = DiscussionTopic.NONE
+    topic = _STAGE_TO_TOPIC.get(workflow.stage, DiscussionTopic.NONE)
+    # PROVIDE_CONTACT maps to None: its topic follows the next missing field.
+    workflow.current_topic = (
+        _topic_from_field(next_missing_field) if topic is None else topic
+    )
 
 
 def create_initial_state(
     semantic_memory: Optional[SemanticMemory] = None,
     desired_reservation: Optional[DesiredReservation] = None,
+    transcript_path: Optional[str] = None,
+    core_memory: Optional[CoreMemory] = None,
 ) -> GlobalMemory:
     """Return a fully initialized memory tree for a new session.
 
     Args:
         semantic_memory: Optional SemanticMemory with custom guest/restaurant data.
         desired_reservation: Optional DesiredReservation with custom booking preferences.
+        transcript_path: Optional JSONL file holding the full conversation log.
+        core_memory: Optional CoreMemory with a custom persona; defaults to Sarah.
 
     Returns:
         A fully initialized GlobalMemory state.
     """
-    state = GlobalMemory()
+    semantic = semantic_memory if semantic_memory is not None else SemanticMemory()
 
-    # Apply custom semantic memory if provided
-    if semantic_memory is not None:
-        state.semantic = semantic_memory
-
-    # Apply custom desired reservation if provided
+    # Apply custom desired reservation if provided (without touching the caller's copy)
     if desired_reservation is not None:
-        state.semantic.desired_reservation = desired_reservation
+        semantic = semantic.model_copy(
+            update={"desired_reservation": desired_reservation}
+        )
+
+    state = (
+        GlobalMemory(semantic=semantic)
+        if core_memory is None
+        else GlobalMemory(core=core_memory, semantic=semantic)
+    )
 
     # Initialize working memory with goal reservation from semantic memory
     desired = state.semantic.desired_reservation
+    # DesiredReservation is a different model, so it cannot be model_copy'd into
+    # ReservationDetails; its fields are splatted instead and re-validated once.
     state.working.goal_reservation = ReservationDetails(
-        date=desired.date,
-        time=desired.time,
-        party_size=desired.party_size,
-        occasion=desired.occasion,
-        special_requests=desired.special_requests,
+        **dict(desired),
         contact_name=state.semantic.guest_name,
         contact_phone=state.semantic.guest_phone,
     )
+    state.working.transcript_path = transcript_path
     _sync_topic_with_stage(state.workflow)
     return state
 
@@ -160,9 +202,32 @@ def create_initial_state(
 def record_user_turn(state: GlobalMemory, message: str) -> GlobalMemory:
     """Append a user utterance in an immutable fashion."""
 
-    new_state = state.model_copy(deep=True)
-    new_state.append_turn("user", message)
-    return new_state
+    # Only the working layer changes; every other layer is shared with `state`.
+    return state.model_copy(
+        update={"working": state.working.with_turn("user", message)}
+    )
+
+
+def _copy_for_update(
+    state: GlobalMemory, copy_confirmed_fields: bool = True
+) -> GlobalMemory:
+    """Copy only the containers that skill handlers mutate in place.
+
+    Handlers assign scalars, fresh lists and new turn logs on
+    `workflow`/`working`, and some flip flags on `workflow.confirmed_fields`;
+    everything else (including the frozen layers) is shared with `state`.
+    """
+
+    workflow = (
+        state.workflow.model_copy(
+            update={"confirmed_fields": state.workflow.confirmed_fields.model_copy()}
+        )
+        if copy_confirmed_fields
+        else state.workflow.model_copy()
+    )
+    return state.model_copy(
+        update={"workflow": workflow, "working": state.working.model_copy()}
+    )
 
 
 def apply_skill_output(
@@ -170,18 +235,19 @@ def apply_skill_output(
 ) -> GlobalMemory:
     """Apply the structured output of a skill to the memory tree."""
 
-    new_state = state.model_copy(deep=True)
-    handler = _HANDLERS.get(skill_name)
-    if handler:
-        handler(new_state, output)
+    handler, touches_confirmed_fields = _HANDLERS[skill_name]
+    new_state = _copy_for_update(state, touches_confirmed_fields)
+    handler(new_state, output)
     return new_state
 
 
 def _handle_greeting(state: GlobalMemory, output: "GreetingSkillOutput") -> None:
     state.append_turn("agent", output.ai_response)
-    state.workflow.stage = WorkflowStage.SHARE_PREFERENCES
-    state.working.pending_questions = []
-    _sync_topic_with_stage(state.workflow)
+    workflow = state.workflow
+    working = state.working
+    workflow.stage = WorkflowStage.SHARE_PREFERENCES
+    working.pending_questions = _NO_QUESTIONS
+    _sync_topic_with_stage(workflow)
 
 
 def _handle_availability(
@@ -189,84 +255,81 @@ def _handle_availability(
 ) -> None:
     state.append_turn("agent", output.ai_response)
     workflow = state.workflow
+    working = state.working
     workflow.availability_status = output.availability_status
     workflow.selected_slot_note = output.selected_slot_note
-    workflow.blocking_issue = None
-    state.working.pending_questions = output.pending_questions
+    working.pending_questions = output.pending_questions
 
-    if getattr(output, "special_request_rejected", False):
+    if output.special_request_rejected:
         workflow.stage = WorkflowStage.WRAP_UP
         workflow.blocking_issue = "special_request_rejected"
         workflow.current_topic = DiscussionTopic.CONFIRMING_SPECIAL_REQUESTS
-        state.working.proposed_alternatives = []
+        working.proposed_alternatives = _NO_ALTERNATIVES
         return
 
+    workflow.blocking_issue = None
     if output.suggested_alternatives:
-        state.working.proposed_alternatives = [
-            AlternativeOption(description=alt, accepted=False)
+        working.proposed_alternatives = [
+            _DEFAULT_ALTERNATIVE.model_copy(update={"description": alt})
             for alt in output.suggested_alternatives
         ]
-    elif output.availability_status == AvailabilityStatus.SLOT_ACCEPTED:
-        state.working.proposed_alternatives = []
+    elif output.availability_status is AvailabilityStatus.SLOT_ACCEPTED:
+        working.proposed_alternatives = _NO_ALTERNATIVES
         # Mark date and time as confirmed when slot is accepted
-        workflow.confirmed_fields.date = True
-        workflow.confirmed_fields.time = True
+        workflow.mark_fields_confirmed(_SLOT_FIELDS)
 
-    if output.availability_status == AvailabilityStatus.SLOT_ACCEPTED:
-        workflow.stage = WorkflowStage.PROVIDE_CONTACT
-    elif output.availability_status == AvailabilityStatus.WAITING_ON_STAFF:
-        workflow.stage = WorkflowStage.AWAIT_AVAILABILITY
-    elif output.availability_status == AvailabilityStatus.ALTERNATIVES_OFFERED:
-        workflow.stage = WorkflowStage.REVIEW_ALTERNATIVES
-    elif output.availability_status == AvailabilityStatus.DECLINED:
-        workflow.stage = WorkflowStage.REVIEW_ALTERNATIVES
-    else:
-        workflow.stage = WorkflowStage.SHARE_PREFERENCES
+    workflow.stage = _AVAILABILITY_STAGES.get(
+        output.availability_status, WorkflowStage.SHARE_PREFERENCES
+    )
 
     next_missing = None
-    if workflow.stage == WorkflowStage.PROVIDE_CONTACT:
-        next_missing = _get_next_missing_field(workflow)
+    if workflow.stage is WorkflowStage.PROVIDE_CONTACT:
+        next_missing = workflow.next_missing_field()
     _sync_topic_with_stage(workflow, next_missing)
 
 
 def _handle_details(state: GlobalMemory, output: "DetailsCollectionOutput") -> None:
     """Collect reservation details one field at a time."""
     state.append_turn("agent", output.ai_response)
-    incoming_details = output.reservation_details or ReservationDetails()
     workflow = state.workflow
-
-    def _mark_if_present(field_name: str, value: Optional[object]) -> None:
-        if value is not None and not getattr(workflow.confirmed_fields, field_name):
-            setattr(workflow.confirmed_fields, field_name, True)
-
-    _mark_if_present("date", incoming_details.date)
-    _mark_if_present("time", incoming_details.time)
-    _mark_if_present("party_size", incoming_details.party_size)
-    _mark_if_present("contact_name", incoming_details.contact_name)
-    _mark_if_present("contact_phone", incoming_details.contact_phone)
-    _mark_if_present("occasion", incoming_details.occasion)
-    _mark_if_present("special_requests", incoming_details.special_requests)
-
-    next_missing = _get_next_missing_field(workflow)
+    incoming_details = output.reservation_details or _NO_DETAILS
+
+    # Straight-line checks: only flags that actually flip are written.
+    confirmed = workflow.confirmed_fields
+    if incoming_details.date is not None and not confirmed.date:
+        confirmed.date = True
+    if incoming_details.time is not None and not confirmed.time:
+        confirmed.time = True
+    if incoming_details.party_size is not None and not confirmed.party_size:
+        confirmed.party_size = True
+    if incoming_details.contact_name is not None and not confirmed.contact_name:
+        confirmed.contact_name = True
+    if incoming_details.contact_phone is not None and not confirmed.contact_phone:
+        confirmed.contact_phone = True
+    if incoming_details.occasion is not None and not confirmed.occasion:
+        confirmed.occasion = True
+    if incoming_details.special_requests is not None and not confirmed.special_requests:
+        confirmed.special_requests = True
 
     # Move to next stage only when all required fields are confirmed
-    if workflow.confirmed_fields.all_required_confirmed():
-        if output.needs_menu_dialog:
-            workflow.stage = WorkflowStage.MENU_DISCUSSION
-            _sync_topic_with_stage(workflow)
-        else:
-            workflow.stage = WorkflowStage.AWAIT_CONFIRMATION
-            _sync_topic_with_stage(workflow)
+    if confirmed.all_required_confirmed():
+        workflow.stage = (
+            WorkflowStage.MENU_DISCUSSION
+            if output.needs_menu_dialog
+            else WorkflowStage.AWAIT_CONFIRMATION
+        )
+        _sync_topic_with_stage(workflow)
     else:
         # Stay in PROVIDE_CONTACT until every required field is explicitly confirmed
         workflow.stage = WorkflowStage.PROVIDE_CONTACT
-        _sync_topic_with_stage(workflow, next_missing)
+        _sync_topic_with_stage(workflow, workflow.next_missing_field())
 
 
 def _handle_menu(state: GlobalMemory, output: "MenuDiscussionOutput") -> None:
     state.append_turn("agent", output.ai_response)
-    state.working.menu_preferences = output.menu_preferences
     workflow = state.workflow
+    working = state.working
+    working.menu_preferences = output.menu_preferences
     workflow.stage = output.next_stage
     _sync_topic_with_stage(workflow)
 
@@ -276,20 +339,21 @@ def _handle_confirmation(
 ) -> None:
     state.append_turn("agent", output.ai_response)
     workflow = state.workflow
+    working = state.working
     topic_missing_field: Optional[str] = None
     workflow.confirmation_status = output.confirmation_status
     workflow.blocking_issue = (
         output.error_message
-        if output.confirmation_status == ConfirmationStatus.PENDING
+        if output.confirmation_status is ConfirmationStatus.PENDING
         else None
     )
     if output.booking_reference:
         workflow.selected_slot_note = output.booking_reference
 
     workflow.missing_explicit_confirmations = []
-    state.working.confirmed_reservation = output.confirmed_reservation
+    working.confirmed_reservation = output.confirmed_reservation
 
-    if output.confirmation_status == ConfirmationStatus.CONFIRMED_BY_STAFF:
+    if output.confirmation_status is ConfirmationStatus.CONFIRMED_BY_STAFF:
         missing_fields = _get_missing_explicit_confirmations(
             state, output.confirmed_reservation
         )
@@ -297,36 +361,25 @@ def _handle_confirmation(
             workflow.confirmation_status = ConfirmationStatus.PENDING
             workflow.missing_explicit_confirmations = missing_fields
             workflow.stage = WorkflowStage.AWAIT_CONFIRMATION
-            state.working.pending_questions = []
+            working.pending_questions = _NO_QUESTIONS
             _sync_topic_with_stage(workflow)
             return
         # Mark all fields as confirmed
-        workflow.confirmed_fields.date = True
-        workflow.confirmed_fields.time = True
-        workflow.confirmed_fields.party_size = True
-        workflow.confirmed_fields.contact_name = True
-        workflow.confirmed_fields.contact_phone = True
-        workflow.confirmed_fields.special_requests = True
+        workflow.mark_fields_confirmed(_STAFF_CONFIRMED_FIELDS)
         workflow.stage = WorkflowStage.SAVE_DATA
         workflow.saved_file_path = None
-        state.working.pending_questions = []
-    elif output.confirmation_status == ConfirmationStatus.NEEDS_CLARIFICATION:
+        working.pending_questions = _NO_QUESTIONS
+    elif output.confirmation_status is ConfirmationStatus.NEEDS_CLARIFICATION:
         workflow.stage = WorkflowStage.PROVIDE_CONTACT
-        state.working.pending_questions = (
-            [output.error_message] if output.error_message else []
+        working.pending_questions = (
+            [output.error_message] if output.error_message else _NO_QUESTIONS
         )
-        workflow.blocking_issue = None
         # Extract which field needs clarification and mark it as not confirmed
-        error_msg = output.error_message or ""
-        if "date" in error_msg.lower():
-            workflow.confirmed_fields.date = False
-        if "time" in error_msg.lower():
-            workflow.confirmed_fields.time = False
-        if "phone" in error_msg.lower():
-            workflow.confirmed_fields.contact_phone = False
-        if "name" in error_msg.lower():
-            workflow.confirmed_fields.contact_name = False
-        topic_missing_field = _get_next_missing_field(workflow)
+        error_msg = (output.error_message or "").lower()
+        for keyword, field_name in _CLARIFICATION_KEYWORDS:
+            if keyword in error_msg:
+                setattr(workflow.confirmed_fields, field_name, False)
+        topic_missing_field = workflow.next_missing_field()
     else:
         workflow.stage = WorkflowStage.AWAIT_CONFIRMATION
 
@@ -356,6 +409,7 @@ def _handle_alternative(
 ) -> None:
     state.append_turn("agent", output.ai_response)
     workflow = state.workflow
+    working = state.working
     topic_missing_field: Optional[str] = None
 
     if output.alternative_selected and output.accepted_slot_description:
@@ -363,16 +417,17 @@ def _handle_alternative(
         workflow.stage = WorkflowStage.PROVIDE_CONTACT
         workflow.selected_slot_note = output.accepted_slot_description
         # Mark date and time as confirmed for the new alternative slot
-        workflow.confirmed_fields.date = True
-        workflow.confirmed_fields.time = True
-        state.working.proposed_alternatives = [
-            AlternativeOption(
-                description=output.accepted_slot_description,
-                notes="accepted by guest",
-                accepted=True,
+        workflow.mark_fields_confirmed(_SLOT_FIELDS)
+        working.proposed_alternatives = [
+            _DEFAULT_ALTERNATIVE.model_copy(
+                update={
+                    "description": output.accepted_slot_description,
+                    "notes": "accepted by guest",
+                    "accepted": True,
+                }
             )
         ]
-        topic_missing_field = _get_next_missing_field(workflow)
+        topic_missing_field = workflow.next_missing_field()
     else:
         workflow.availability_status = AvailabilityStatus.ALTERNATIVES_OFFERED
         if output.should_end_conversation:
@@ -385,22 +440,27 @@ def _handle_alternative(
 
 def _handle_error_recovery(state: GlobalMemory, output: "ErrorRecoveryOutput") -> None:
     state.append_turn("agent", output.ai_response)
-    state.workflow.stage = output.reset_stage
-    state.workflow.blocking_issue = None
-    state.workflow.confirmation_status = ConfirmationStatus.PENDING
+    workflow = state.workflow
+    workflow.stage = output.reset_stage
+    workflow.blocking_issue = None
+    workflow.confirmation_status = ConfirmationStatus.PENDING
     next_missing = None
-    if state.workflow.stage == WorkflowStage.PROVIDE_CONTACT:
-        next_missing = _get_next_missing_field(state.workflow)
-    _sync_topic_with_stage(state.workflow, next_missing)
-
-
-_HANDLERS: Dict[SkillName, UpdateHandler] = {
-    SkillName.GREETING: _handle_greeting,
-    SkillName.AVAILABILITY: _handle_availability,
-    SkillName.DETAILS_COLLECTION: _handle_details,
-    SkillName.MENU_DISCUSSION: _handle_menu,
-    SkillName.CONFIRMATION: _handle_confirmation,
-    SkillName.ALTERNATIVE: _handle_alternative,
-    SkillName.ERROR_RECOVERY: _handle_error_recovery,
-    SkillName.SAVE_RESERVATION: _handle_save_reservation,
+    if workflow.stage is WorkflowStage.PROVIDE_CONTACT:
+        next_missing = workflow.next_missing_field()
+    _sync_topic_with_stage(workflow, next_missing)
+
+
+_HANDLERS: Dict[SkillName, _HandlerSpec] = {
+    SkillName.GREETING: _HandlerSpec(_handle_greeting, False),
+    SkillName.AVAILABILITY: _HandlerSpec(_handle_availability, True),
+    SkillName.DETAILS_COLLECTION: _HandlerSpec(_handle_details, True),
+    SkillName.MENU_DISCUSSION: _HandlerSpec(_handle_menu, False),
+    SkillName.CONFIRMATION: _HandlerSpec(_handle_confirmation, True),
+    SkillName.ALTERNATIVE: _HandlerSpec(_handle_alternative, True),
+    SkillName.ERROR_RECOVERY: _HandlerSpec(_handle_error_recovery, False),
+    SkillName.SAVE_RESERVATION: _HandlerSpec(_handle_save_reservation, False),
 }
+
+# Every skill has a handler, so `apply_skill_output` can index the table directly.
+if _HANDLERS.keys() != set(SkillName):
+    raise RuntimeError("every SkillName needs a state handler")
@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
-import json
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+import orjson
 
 from memory.models import GlobalMemory, ReservationDetails
 
 _RESERVATION_DIR = Path(__file__).resolve().parent.parent / "reservations"
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Directory already created by `_ensure_output_dir`; later saves skip the mkdir.
+_READY_DIR: Optional[Path] = None
 
 
 def _ensure_output_dir() -> Path:
-    _RESERVATION_DIR.mkdir(parents=True, exist_ok=True)
-    return _RESERVATION_DIR
+    global _READY_DIR
+    output_dir = _RESERVATION_DIR
+    if _READY_DIR is not output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _READY_DIR = output_dir
+    return output_dir
 
 
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+    slug = _SLUG_RE.sub("_", value.lower()).strip("_")
     return slug or "reservation"
 
 
@@ -35,17 +46,61 @@ def _serialize_reservation(details: ReservationDetails) -> Dict[str, Any]:
     }
 
 
+# ReservationDetails is frozen and hashable, and the goal reservation never
+# changes after `create_initial_state`, so it is serialized once per session.
+# The confirmed reservation changes with every confirmation and is not cached.
+_serialize_goal_reservation = lru_cache(maxsize=8)(_serialize_reservation)
+
+
+def transcript_path_for(guest_name: str) -> Path:
+    """Return a fresh JSONL transcript path for a new conversation."""
+
+    output_dir = _ensure_output_dir()
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    # Agents started within the same second (e.g. `--runs`) must not share a file.
+    suffix = uuid4().hex[:8]
+    return output_dir / f"{_slugify(guest_name)}_{timestamp}_{suffix}.transcript.jsonl"
+
+
+def append_transcript_turn(path: str | Path, speaker: str, message: str) -> None:
+    """Append one conversation turn to the JSONL transcript."""
+
+    record = orjson.dumps({"speaker": speaker, "message": message})
+    with open(path, "ab") as handle:
+        handle.write(record + b"\n")
+
+
+def load_transcript(path: str | Path) -> List[Dict[str, str]]:
+    """Read every turn stored in a JSONL transcript."""
+
+    with open(path, "rb") as handle:
+        return [orjson.loads(line) for line in handle if line.strip()]
+
+
+def _conversation_turns(state: GlobalMemory) -> List[Dict[str, str]]:
+    """Full turn history: the transcript when available, else the in-memory window."""
+
+    transcript_path = state.working.transcript_path
+    if transcript_path and Path(transcript_path).exists():
+        return load_transcript(transcript_path)
+    # Turns are frozen and hold exactly speaker/message, so their field dicts can
+    # be serialized as-is instead of rebuilding one dict per turn.
+    return [turn.__dict__ for turn in state.working.turns]
+
+
 def save_reservation_snapshot(state: GlobalMemory) -> Path:
     """Persist the reservation summary to disk and return the file path."""
 
     output_dir = _ensure_output_dir()
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    # One clock read so the file name and `generated_at` always agree.
+    now = datetime.now(timezone.utc)
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     guest_slug = _slugify(state.semantic.guest_name)
     filename = f"{guest_slug}_{timestamp}.json"
     file_path = output_dir / filename
 
     payload = {
-        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "generated_at": now.isoformat(timespec="seconds").replace("+00:00", "Z"),
         "guest": {
             "name": state.semantic.guest_name,
             "phone": state.semantic.guest_phone,
@@ -57,7 +112,10 @@ def save_reservation_snapshot(state: GlobalMemory) -> Path:
             "confirmation_status": state.workflow.confirmation_status,
             "selected_slot_note": state.workflow.selected_slot_note,
         },
-        "goal_reservation": _serialize_reservation(state.working.goal_reservation),
+        # Copied so the cached dict cannot be changed through the snapshot.
+        "goal_reservation": _serialize_goal_reservation(
+            state.working.goal_reservation
+        ).copy(),
         "confirmed_reservation": _serialize_reservation(
             state.working.confirmed_reservation
         ),
@@ -67,12 +125,11 @@ def save_reservation_snapshot(state: GlobalMemory) -> Path:
             "dietary_notes": state.working.menu_preferences.dietary_notes,
         },
         "conversation_summary": {
-            "turns": [
-                {"speaker": turn.speaker, "message": turn.message}
-                for turn in state.working.turns
-            ],
+            "turns": _conversation_turns(state),
         },
     }
 
-    file_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # orjson encodes enums natively and returns UTF-8 bytes, so there is no
+    # intermediate str to build and re-encode.
+    file_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     return file_path
@@ -3,6 +3,7 @@
 from shared.enums import (
     AvailabilityStatus,
     ConfirmationStatus,
+    DiscussionTopic,
     SkillName,
     WorkflowStage,
 )  # noqa: F401
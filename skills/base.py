@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Mapping, Type
+from typing import Any, Iterable, List, Mapping, Type
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 from pydantic import BaseModel
 
 from shared.enums import SkillName
@@ -19,9 +19,38 @@ class Skill:
     template_path: str
     output_model: Type[BaseModel]
     description: str
+    # Prelude built only from the read-only core/semantic layers; it is rendered
+    # once per session and prepended to every prompt of this skill.
+    static_template_path: str = "skills/static/guest_profile.j2"
+
+    def get_template(self, env: Environment) -> Template:
+        """Return the compiled Jinja template for this skill."""
+
+        return env.get_template(self.template_path)
+
+    def get_static_template(self, env: Environment) -> Template:
+        """Return the compiled template for the session-static prelude."""
+
+        return env.get_template(self.static_template_path)
+
+    def render_static(self, env: Environment, context: Mapping[str, Any]) -> str:
+        """Render the prelude that depends only on `state.core`/`state.semantic`."""
+
+        return self.get_static_template(env).render(context)
 
     def render_prompt(self, env: Environment, context: Mapping[str, Any]) -> str:
-        """Render the Jinja template with a supplied context."""
+        """Render the full prompt (static prelude plus per-turn body)."""
+
+        return self.render_static(env, context) + self.get_template(env).render(context)
+
+    def render_many(
+        self, env: Environment, contexts: Iterable[Mapping[str, Any]]
+    ) -> List[str]:
+        """Render full prompts for many contexts, resolving each template once."""
 
-        template = env.get_template(self.template_path)
-        return template.render(**context)
+        static_template = self.get_static_template(env)
+        template = self.get_template(env)
+        return [
+            static_template.render(context) + template.render(context)
+            for context in contexts
+        ]
@@ -2,19 +2,40 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from memory._copy import smart_deepcopy
 from memory.models import MenuPreferences, ReservationDetails
 from shared.enums import AvailabilityStatus, ConfirmationStatus, WorkflowStage
 
+_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+
+# Nested defaults below are built with `model_construct`: an all-default value
+# has nothing to validate. LLM responses are still validated by instructor.
+
 
 class SkillOutput(BaseModel):
     """Base class for every structured response."""
 
     ai_response: str
 
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Return the JSON schema, generated once per class for default arguments.
+
+        instructor requests the schema on every LLM call; a copy of the cached
+        schema is returned because some instructor modes edit it in place.
+        """
+
+        if args or kwargs:
+            return super().model_json_schema(*args, **kwargs)
+        schema = _SCHEMA_CACHE.get(cls)
+        if schema is None:
+            schema = _SCHEMA_CACHE[cls] = super().model_json_schema()
+        return smart_deepcopy(schema)
+
 
 class GreetingSkillOutput(SkillOutput):
     """Greeting responses do not need extra structure."""
@@ -33,14 +54,18 @@ class AvailabilitySkillOutput(SkillOutput):
 class DetailsCollectionOutput(SkillOutput):
     """Collects information required for a booking."""
 
-    reservation_details: ReservationDetails = Field(default_factory=ReservationDetails)
+    reservation_details: ReservationDetails = Field(
+        default_factory=ReservationDetails.model_construct
+    )
     needs_menu_dialog: bool = False
 
 
 class MenuDiscussionOutput(SkillOutput):
     """Captures menu-related questions or highlights."""
 
-    menu_preferences: MenuPreferences = Field(default_factory=MenuPreferences)
+    menu_preferences: MenuPreferences = Field(
+        default_factory=MenuPreferences.model_construct
+    )
     next_stage: WorkflowStage = WorkflowStage.AWAIT_CONFIRMATION
 
 
@@ -51,7 +76,7 @@ class ConfirmationSkillOutput(SkillOutput):
     booking_reference: Optional[str] = None
     error_message: Optional[str] = None
     confirmed_reservation: ReservationDetails = Field(
-        default_factory=ReservationDetails
+        default_factory=ReservationDetails.model_construct
     )
 
 
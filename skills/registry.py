@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 from skills.base import Skill
 from skills import outputs
@@ -24,6 +25,7 @@ _SKILLS: Dict[SkillName, Skill] = {
     SkillName.DETAILS_COLLECTION: Skill(
         name=SkillName.DETAILS_COLLECTION,
         template_path="skills/details.j2",
+        static_template_path="skills/static/persona.j2",
         output_model=outputs.DetailsCollectionOutput,
         description="Provide the guest's booking metadata and confirm next steps.",
     ),
@@ -48,6 +50,7 @@ _SKILLS: Dict[SkillName, Skill] = {
     SkillName.ERROR_RECOVERY: Skill(
         name=SkillName.ERROR_RECOVERY,
         template_path="skills/error_recovery.j2",
+        static_template_path="skills/static/persona.j2",
         output_model=outputs.ErrorRecoveryOutput,
         description="Recover from booking errors and restart the request if needed.",
     ),
@@ -59,6 +62,8 @@ _SKILLS: Dict[SkillName, Skill] = {
     ),
 }
 
+_SKILLS_VIEW: Mapping[SkillName, Skill] = MappingProxyType(_SKILLS)
+
 
 def get_skill(skill_name: SkillName) -> Skill:
     """Return the requested skill definition."""
@@ -66,7 +71,7 @@ def get_skill(skill_name: SkillName) -> Skill:
     return _SKILLS[skill_name]
 
 
-def all_skills() -> Dict[SkillName, Skill]:
-    """Expose the internal registry for inspection/testing."""
+def all_skills() -> Mapping[SkillName, Skill]:
+    """Expose a read-only view of the registry for inspection/testing."""
 
-    return _SKILLS.copy()
+    return _SKILLS_VIEW
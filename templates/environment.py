@@ -2,20 +2,71 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
+from typing import Dict, Optional
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+)
 
 _TEMPLATES_PATH = Path(__file__).resolve().parent
 
 
+def _dev_mode() -> bool:
+    return os.getenv("AGENT_DEV", "") == "1"
+
+
+def _read_templates() -> Dict[str, str]:
+    return {
+        path.relative_to(_TEMPLATES_PATH).as_posix(): path.read_text(encoding="utf-8")
+        for path in _TEMPLATES_PATH.rglob("*.j2")
+    }
+
+
+def _loader() -> BaseLoader:
+    # Outside dev mode every template is read once up front, so compiling never
+    # touches the filesystem; dev mode keeps the file loader for live edits.
+    if _dev_mode():
+        return FileSystemLoader(str(_TEMPLATES_PATH))
+    return DictLoader(_read_templates())
+
+
+def _bytecode_cache() -> Optional[BytecodeCache]:
+    # Compiled templates persist across processes only when a directory is set.
+    directory = os.getenv("AGENT_TEMPLATE_CACHE_DIR")
+    if not directory:
+        return None
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
+
+
 def create_environment() -> Environment:
     """Return a configured Jinja2 environment for the agent templates."""
 
     return Environment(
-        loader=FileSystemLoader(str(_TEMPLATES_PATH)),
+        loader=_loader(),
         autoescape=False,
         trim_blocks=True,
         lstrip_blocks=True,
         undefined=StrictUndefined,
+        cache_size=-1,
+        # Templates ship with the code, so skip the per-lookup mtime check unless
+        # a developer is editing them (AGENT_DEV=1).
+        auto_reload=_dev_mode(),
+        bytecode_cache=_bytecode_cache(),
     )
+
+
+@functools.lru_cache(maxsize=1)
+def get_environment() -> Environment:
+    """Return the process-wide environment, shared so templates compile once."""
+
+    return create_environment()
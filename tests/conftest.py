@@ -0,0 +1,38 @@
+"""Shared fixtures for the agent test suite."""
+
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+import pytest
+from pydantic import BaseModel
+
+# engine.conversation must be imported before memory.state_manager (cycle).
+import engine.conversation  # noqa: F401
+import persistence.json_saver as json_saver
+from shared.enums import SkillName
+
+
+class ScriptedLLM:
+    """Sync LLM stub that replays `(skill, output)` pairs in order."""
+
+    def __init__(self, script: List[Tuple[SkillName, BaseModel]]) -> None:
+        self.script = list(script)
+        self.prompts: List[str] = []
+
+    def generate(
+        self, prompt: str, response_model: type[BaseModel], **kwargs: Any
+    ) -> BaseModel:
+        self.prompts.append(prompt)
+        skill_name, output = self.script.pop(0)
+        assert kwargs["skill"].name is skill_name
+        return output
+
+
+@pytest.fixture
+def reservation_dir(tmp_path, monkeypatch):
+    """Redirect reservation snapshots into a temporary directory."""
+
+    directory = tmp_path / "reservations"
+    monkeypatch.setattr(json_saver, "_RESERVATION_DIR", directory)
+    return directory
@@ -0,0 +1,17 @@
+"""Command-line argument validation."""
+
+from __future__ import annotations
+
+import pytest
+
+import app
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "two"])
+def test_runs_must_be_a_positive_integer(value):
+    with pytest.raises(SystemExit):
+        app._parse_args(["--runs", value])
+
+
+def test_runs_accepts_positive_counts():
+    assert app._parse_args(["--runs", "3"]).runs == 3
@@ -0,0 +1,86 @@
+"""BatchExecutor groups same-skill turns into object-wrapped batch calls."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List
+
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from engine.batch_executor import BatchExecutor
+from memory.models import DesiredReservation, SemanticMemory
+from memory.state_manager import create_initial_state
+from shared.enums import SkillName
+
+
+class BatchLLM:
+    """Async stub that answers every task of a batch prompt in order."""
+
+    def __init__(self, drop_last: bool = False) -> None:
+        self.drop_last = drop_last
+        self.calls: List[tuple[str, type[BaseModel]]] = []
+
+    async def agenerate(
+        self, prompt: str, response_model: type[BaseModel], **kwargs: Any
+    ) -> BaseModel:
+        self.calls.append((prompt, response_model))
+        tasks = prompt.count("### Task ")
+        if self.drop_last:
+            tasks -= 1
+        name = kwargs["skill"].name.value
+        # Providers in JSON mode return a top-level object.
+        return response_model.model_validate_json(
+            orjson.dumps(
+                {"items": [{"ai_response": f"{name}:{i}"} for i in range(tasks)]}
+            )
+        )
+
+
+def _requests(count: int):
+    return [
+        (
+            SkillName.GREETING if index % 3 else SkillName.SAVE_RESERVATION,
+            create_initial_state(
+                SemanticMemory.create(restaurant_name="R", guest_name=f"Guest {index}"),
+                DesiredReservation(),
+            ),
+            "",
+        )
+        for index in range(count)
+    ]
+
+
+def test_outputs_come_back_in_request_order():
+    llm = BatchLLM()
+    executor = BatchExecutor(llm, max_batch_size=3)
+
+    outputs = asyncio.run(executor.run_batch(_requests(7)))
+
+    assert [output.ai_response for output in outputs] == [
+        "skill.save_reservation:0",
+        "skill.greeting:0",
+        "skill.greeting:1",
+        "skill.save_reservation:1",
+        "skill.greeting:2",
+        "skill.greeting:0",
+        "skill.save_reservation:2",
+    ]
+    # 4 greetings -> batches of 3 + 1; 3 saves -> one batch.
+    assert len(llm.calls) == 3
+
+
+def test_batch_response_model_is_a_json_object():
+    llm = BatchLLM()
+    asyncio.run(BatchExecutor(llm).run_batch(_requests(2)))
+
+    schema = llm.calls[0][1].model_json_schema()
+    assert schema["type"] == "object"
+    assert "items" in schema["properties"]
+    assert '{"items": [...]}' in llm.calls[0][0]
+
+
+def test_short_batch_response_is_rejected():
+    with pytest.raises(ValueError):
+        asyncio.run(BatchExecutor(BatchLLM(drop_last=True)).run_batch(_requests(2)))
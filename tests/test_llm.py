@@ -0,0 +1,117 @@
+"""Shared limits and connection pool of the async OpenRouter client."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from engine.llm import AsyncOpenRouterLLMClient
+
+
+class FakePool:
+    """Stands in for the httpx connection pool; only closing is observable."""
+
+    def __init__(self) -> None:
+        self.is_closed = False
+
+    async def aclose(self) -> None:
+        self.is_closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_pool(monkeypatch):
+    monkeypatch.setattr(
+        AsyncOpenRouterLLMClient,
+        "_new_http_client",
+        classmethod(lambda cls: FakePool()),
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    return AsyncOpenRouterLLMClient()
+
+
+async def _use_and_close(client: AsyncOpenRouterLLMClient):
+    resources = AsyncOpenRouterLLMClient._resources()
+    async with resources.semaphore:
+        await resources.bucket.acquire()
+    assert AsyncOpenRouterLLMClient._resources() is resources
+    await client.aclose()
+    return resources
+
+
+def test_each_event_loop_gets_its_own_limits(client):
+    first = asyncio.run(_use_and_close(client))
+    second = asyncio.run(_use_and_close(client))
+
+    assert second.semaphore is not first.semaphore
+    assert second.bucket is not first.bucket
+    assert second.http_client is not first.http_client
+    assert first.http_client.is_closed and second.http_client.is_closed
+
+
+def test_bucket_bursts_at_most_one_second_of_budget(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_REQUESTS_PER_MINUTE", "600")
+
+    async def burst() -> int:
+        bucket = AsyncOpenRouterLLMClient._resources().bucket
+        granted = 0
+        while True:
+            try:
+                await asyncio.wait_for(bucket.acquire(), timeout=0.01)
+            except asyncio.TimeoutError:
+                return granted
+            granted += 1
+
+    assert asyncio.run(burst()) <= 11
+
+
+def test_aclose_closes_the_loop_pool(client):
+    async def use_and_close():
+        pool = AsyncOpenRouterLLMClient._resources().http_client
+        async with client:
+            assert AsyncOpenRouterLLMClient._resources().http_client is pool
+        assert pool.is_closed
+        assert AsyncOpenRouterLLMClient._resources().http_client is not pool
+
+    asyncio.run(use_and_close())
+
+
+def test_rate_limit_wrapped_by_instructor_is_retried(client, monkeypatch):
+    import tenacity
+    from instructor.core import InstructorRetryException
+    from openai import RateLimitError
+
+    from skills.outputs import GreetingSkillOutput
+
+    monkeypatch.setattr(tenacity, "wait_exponential_jitter", tenacity.wait_none)
+    # RateLimitError only reads these attributes of the HTTP response.
+    response = SimpleNamespace(status_code=429, headers={}, request=None)
+    calls = []
+
+    class Completions:
+        async def create(self, **kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                try:
+                    raise RateLimitError("slow down", response=response, body=None)
+                except RateLimitError as exc:
+                    raise InstructorRetryException(
+                        str(exc), n_attempts=1, total_usage=0
+                    ) from exc
+            return GreetingSkillOutput(ai_response="hello")
+
+    class FakeClient:
+        class chat:
+            completions = Completions()
+
+    monkeypatch.setattr(client, "_client_for", lambda resources: FakeClient())
+
+    output = asyncio.run(client.agenerate("prompt", GreetingSkillOutput))
+
+    assert output.ai_response == "hello"
+    assert len(calls) == 2
@@ -0,0 +1,50 @@
+"""Behaviour of the mutable memory layers."""
+
+from __future__ import annotations
+
+from memory.models import ConfirmedFields, WorkflowMemory
+from memory.state_manager import (
+    _SLOT_FIELDS,
+    _STAFF_CONFIRMED_FIELDS,
+    _copy_for_update,
+    create_initial_state,
+)
+
+
+def test_mark_fields_confirmed_sets_flags_and_fields_set():
+    workflow = WorkflowMemory()
+
+    workflow.mark_fields_confirmed(("date", "time"))
+
+    confirmed = workflow.confirmed_fields
+    assert confirmed.date and confirmed.time and not confirmed.party_size
+    assert confirmed.model_dump(exclude_unset=True) == {"date": True, "time": True}
+
+
+def test_confirmed_field_groups_name_real_fields():
+    assert set(_STAFF_CONFIRMED_FIELDS) <= ConfirmedFields.model_fields.keys()
+    assert set(_SLOT_FIELDS) <= ConfirmedFields.model_fields.keys()
+
+
+def test_next_missing_field_follows_confirmations():
+    workflow = WorkflowMemory()
+    assert workflow.next_missing_field() == "party_size"
+
+    workflow.mark_fields_confirmed(("party_size", "contact_name"))
+    assert workflow.next_missing_field() == "contact_phone"
+
+    workflow.confirmed_fields.party_size = False
+    assert workflow.next_missing_field() == "party_size"
+
+
+def test_next_missing_field_tracks_copies_independently():
+    state = create_initial_state()
+    assert state.workflow.next_missing_field() == "party_size"
+
+    updated = _copy_for_update(state)
+    updated.workflow.mark_fields_confirmed(("party_size", "contact_name"))
+    assert updated.workflow.next_missing_field() == "contact_phone"
+    assert state.workflow.next_missing_field() == "party_size"
+
+    updated.workflow.confirmed_fields = ConfirmedFields()
+    assert updated.workflow.next_missing_field() == "party_size"
@@ -0,0 +1,35 @@
+"""JSON guest profiles supply both the guest data and the persona."""
+
+from __future__ import annotations
+
+import app
+from engine.conversation import ReservationAgent
+from shared.enums import SkillName
+from skills.outputs import GreetingSkillOutput
+
+from conftest import ScriptedLLM
+
+
+def _opening_prompt(profile: str) -> str:
+    semantic_memory, desired_reservation, core_memory = app._load_profile(profile)
+    llm = ScriptedLLM([(SkillName.GREETING, GreetingSkillOutput(ai_response="hello"))])
+    agent = ReservationAgent(
+        semantic_memory=semantic_memory,
+        desired_reservation=desired_reservation,
+        llm_client=llm,
+        core_memory=core_memory,
+    )
+    agent.step(None)
+    return llm.prompts[0]
+
+
+def test_json_profile_renders_its_own_persona():
+    prompt = _opening_prompt("klara")
+
+    assert "- name: Klara" in prompt
+    assert "You are Klara Nowak" in prompt
+    assert "Sarah" not in prompt
+
+
+def test_default_profile_keeps_builtin_persona():
+    assert "You are Sarah Mitchell" in _opening_prompt("default")
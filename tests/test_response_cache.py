@@ -0,0 +1,24 @@
+"""In-memory response cache bounds."""
+
+from __future__ import annotations
+
+from engine.response_cache import ResponseCache
+from skills.outputs import GreetingSkillOutput
+
+
+def _key(cache: ResponseCache, prompt: str) -> bytes:
+    return cache.make_key("model", prompt, GreetingSkillOutput)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    first, second, third = (_key(cache, p) for p in ("a", "b", "c"))
+    cache.put(first, GreetingSkillOutput(ai_response="a"))
+    cache.put(second, GreetingSkillOutput(ai_response="b"))
+
+    assert cache.get(first, GreetingSkillOutput) is not None
+    cache.put(third, GreetingSkillOutput(ai_response="c"))
+
+    assert cache.get(second, GreetingSkillOutput) is None
+    assert cache.get(first, GreetingSkillOutput).ai_response == "a"
+    assert cache.get(third, GreetingSkillOutput).ai_response == "c"
@@ -0,0 +1,54 @@
+"""Streaming replies must add up to the final reply the state records."""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, List
+
+from pydantic import BaseModel
+
+from engine.conversation import ReservationAgent
+from memory.models import DesiredReservation, SemanticMemory
+from shared.enums import SkillName
+from skills import outputs
+
+from conftest import ScriptedLLM
+
+
+class StreamingScriptedLLM(ScriptedLLM):
+    """Streams `partials` as incomplete outputs before each scripted reply."""
+
+    def __init__(self, script, partials: List[str]) -> None:
+        super().__init__(script)
+        self.partials = partials
+
+    def stream_generate(
+        self, prompt: str, response_model: type[BaseModel], **kwargs: Any
+    ) -> Iterator[BaseModel]:
+        for text in self.partials:
+            yield response_model.model_construct(ai_response=text)
+        yield self.generate(prompt, response_model, **kwargs)
+
+
+def _stream_greeting(partials: List[str], final: str) -> List[str]:
+    llm = StreamingScriptedLLM(
+        [(SkillName.GREETING, outputs.GreetingSkillOutput(ai_response=final))],
+        partials,
+    )
+    agent = ReservationAgent(SemanticMemory(), DesiredReservation(), llm_client=llm)
+    deltas = [delta for delta, _ in agent.stream_step()]
+    assert agent.state.working.last_ai_message == final
+    return deltas
+
+
+def test_stream_step_emits_the_remainder_of_a_streamed_prefix():
+    deltas = _stream_greeting(["Hel", "Hello, I"], "Hello, I would like a table.")
+
+    # The last pair only carries `done` once the whole reply was streamed.
+    assert deltas == ["Hel", "lo, I", " would like a table.", ""]
+
+
+def test_stream_step_restates_a_final_reply_that_diverges(caplog):
+    deltas = _stream_greeting(["Hello, I"], "Good evening, I would like a table.")
+
+    assert deltas == ["Hello, I", "\nGood evening, I would like a table."]
+    assert "diverged" in caplog.text
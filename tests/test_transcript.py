@@ -0,0 +1,83 @@
+"""Saved snapshots must contain the full dialogue when a transcript is kept."""
+
+from __future__ import annotations
+
+from datetime import date, time
+
+import orjson
+
+from engine.conversation import ReservationAgent
+from memory.models import DesiredReservation, ReservationDetails, SemanticMemory
+from persistence import json_saver
+from shared.enums import SkillName
+from skills import outputs
+
+from conftest import ScriptedLLM
+
+_DETAILS = ReservationDetails(
+    date=date(2030, 1, 1),
+    time=time(19, 0),
+    party_size=2,
+    occasion="dinner",
+    special_requests="window seat",
+    contact_name="Sarah Mitchell",
+    contact_phone="555",
+)
+
+_SCRIPT = [
+    (SkillName.GREETING, outputs.GreetingSkillOutput(ai_response="hello")),
+    (
+        SkillName.AVAILABILITY,
+        outputs.AvailabilitySkillOutput(
+            ai_response="7pm works?", availability_status="slot_accepted"
+        ),
+    ),
+    (
+        SkillName.DETAILS_COLLECTION,
+        outputs.DetailsCollectionOutput(
+            ai_response="details", reservation_details=_DETAILS
+        ),
+    ),
+    (
+        SkillName.CONFIRMATION,
+        outputs.ConfirmationSkillOutput(
+            ai_response="confirmed?",
+            confirmation_status="confirmed_by_staff",
+            confirmed_reservation=_DETAILS,
+        ),
+    ),
+    (SkillName.SAVE_RESERVATION, outputs.SaveReservationOutput(ai_response="bye")),
+]
+
+
+def _run_dialogue(transcript_path):
+    agent = ReservationAgent(
+        semantic_memory=SemanticMemory.create(
+            restaurant_name="Azure", guest_name="Sarah Mitchell"
+        ),
+        desired_reservation=DesiredReservation(
+            date=date(2030, 1, 1), time=time(19, 0), special_requests="window seat"
+        ),
+        llm_client=ScriptedLLM(_SCRIPT),
+        transcript_path=transcript_path,
+    )
+    _, done = agent.step(None)
+    staff = iter(["yes", "we have a table", "all noted", "booked"])
+    while not done:
+        _, done = agent.step(next(staff))
+    saved = agent.state.workflow.saved_file_path
+    return orjson.loads(open(saved, "rb").read())["conversation_summary"]["turns"]
+
+
+def test_snapshot_with_transcript_ends_on_final_agent_reply(reservation_dir, tmp_path):
+    turns = _run_dialogue(tmp_path / "dialogue.transcript.jsonl")
+
+    assert turns[-1] == {"speaker": "agent", "message": "bye"}
+    assert turns == _run_dialogue(None)
+
+
+def test_transcript_paths_are_unique_within_a_second(reservation_dir):
+    paths = {json_saver.transcript_path_for("Sarah Mitchell") for _ in range(20)}
+
+    assert len(paths) == 20
+    assert all(path.parent == reservation_dir for path in paths)
@@ -0,0 +1,68 @@
+"""Arena sharing, windowing and serialization of `TurnLog`."""
+
+from __future__ import annotations
+
+from memory.models import (
+    MAX_TURNS_WINDOW,
+    ConversationTurn,
+    TurnLog,
+    WorkingMemory,
+)
+
+
+def _turn(index: int) -> ConversationTurn:
+    return ConversationTurn(speaker="user", message=f"m{index}")
+
+
+def _messages(log: TurnLog) -> list[str]:
+    return [turn.message for turn in log]
+
+
+def test_appending_to_older_snapshot_forks_instead_of_leaking():
+    base = TurnLog().appended(_turn(0), window=10)
+    parent = base.appended(_turn(1), window=10)
+    child = base.appended(_turn(2), window=10)
+    grandchild = parent.appended(_turn(3), window=10)
+
+    assert _messages(base) == ["m0"]
+    assert _messages(parent) == ["m0", "m1"]
+    assert _messages(child) == ["m0", "m2"]
+    assert _messages(grandchild) == ["m0", "m1", "m3"]
+    assert child._arena is not parent._arena
+
+
+def test_window_keeps_only_the_newest_turns():
+    log = TurnLog()
+    for index in range(MAX_TURNS_WINDOW + 5):
+        log = log.appended(_turn(index), MAX_TURNS_WINDOW)
+
+    assert len(log) == MAX_TURNS_WINDOW
+    assert log[0].message == "m5"
+    assert log[-1].message == f"m{MAX_TURNS_WINDOW + 4}"
+
+
+def test_compaction_rebases_offsets_and_counts_archived_turns():
+    working = WorkingMemory()
+    total = 3 * MAX_TURNS_WINDOW
+    for index in range(total):
+        working = working.with_turn("user", f"m{index}")
+
+    turns = working.turns
+    assert working.archived_turn_count == total - MAX_TURNS_WINDOW
+    assert _messages(turns) == [f"m{i}" for i in range(total - MAX_TURNS_WINDOW, total)]
+    # Evicted turns are dropped from the arena once they outnumber the window.
+    assert turns._start <= MAX_TURNS_WINDOW
+    assert len(turns._arena) <= 2 * MAX_TURNS_WINDOW + 1
+
+
+def test_turns_round_trip_through_json():
+    working = WorkingMemory()
+    for index in range(3):
+        working = working.with_turn("user" if index % 2 else "agent", f"m{index}")
+
+    restored = WorkingMemory.model_validate_json(working.model_dump_json())
+
+    assert isinstance(restored.turns, TurnLog)
+    assert restored.turns == working.turns
+    assert restored.last_ai_message == "m2"
+    assert restored.last_user_message == "m1"